@@ -12,150 +12,271 @@ Then run this test:
 
 from __future__ import annotations
 
+import io
 import json
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 import sys
 import os
-import httpx
 
-from mcp_sse_client import McpSseClient
+# httpx and the SSE client are imported where they are used, so that
+# importing this module stays cheap.
+if TYPE_CHECKING:
+    from time_range_parser_lib.mcp_sse_client import McpSseClient
+
+# orjson is optional: faster (de)serialization, stdlib json as fallback
+try:
+    import orjson
+
+    def dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    loads = orjson.loads
+except ImportError:
+
+    def dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    loads = json.loads
 
 # Server root URL (MCP is mounted at /mcp)
 SERVER_ROOT = "http://localhost:9000"
-BASE_URL = f"{SERVER_ROOT}/mcp"
-SSE_URL = f"{BASE_URL}/sse"  # This is for reference; we'll override in the client
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoints:
+    """Server URLs, derived once from the server root."""
+
+    base: str
+    mcp: str
+    sse: str
+    health: str
+
+    @classmethod
+    def from_root(cls, root: str) -> Endpoints:
+        mcp = f"{root}/mcp"
+        return cls(base=root, mcp=mcp, sse=f"{mcp}/sse", health=f"{root}/health")
+
+
+INIT_PARAMS: dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {"name": "mcp-client-httpx", "version": "0.2.0"},
+}
+
+# Argument that labels a report entry, per tool (None: label with the tool name)
+TOOL_LABEL_KEY: dict[str, str | None] = {
+    "resolve_time_range": "text",
+    "expand_recurrence": "text",
+    "convert_timezone": "text",
+    "calculate_duration": "start",
+    "server_info": None,
+}
 
 
 class MarkdownReporter:
     def __init__(self) -> None:
-        self.lines: list[str] = []
+        self.buf = io.StringIO()
+
+    def _line(self, line: str = "") -> None:
+        self.buf.write(line)
+        self.buf.write("\n")
 
     def header(self, level: int, text: str) -> None:
-        self.lines.append(f"{'#' * level} {text}")
-        self.lines.append("")
+        self._line(f"{'#' * level} {text}")
+        self._line()
 
     def text(self, text: str) -> None:
-        self.lines.append(text)
-        self.lines.append("")
+        self._line(text)
+        self._line()
 
     def code_block(self, code: str, lang: str = "json") -> None:
-        self.lines.append(f"```{lang}")
-        self.lines.append(code)
-        self.lines.append("```")
-        self.lines.append("")
+        self.buf.write(f"```{lang}\n{code}\n```\n\n")
 
     def tool_call(
         self, tool_name: str, arguments: dict[str, Any], response: dict[str, Any]
     ) -> None:
         # Determine a label for the test case
-        if "text" in arguments:
-            self.lines.append(f"**Input**: `{arguments['text']}`")
-        elif "start_text" in arguments:
-            self.lines.append(f"**Input**: `{arguments['start_text']}`")
-        elif "start" in arguments:
-            self.lines.append(f"**Input**: `{arguments['start']}`")
+        key = TOOL_LABEL_KEY.get(tool_name)
+        if key in arguments:
+            self._line(f"**Input**: `{arguments[key]}`")
         else:
-            self.lines.append(f"**Tool**: `{tool_name}`")
+            self._line(f"**Tool**: `{tool_name}`")
 
         # Format arguments nicely
         args_str = ", ".join(f"`{k}={v}`" for k, v in arguments.items())
-        self.lines.append(f"- **Arguments**: {args_str}")
+        self._line(f"- **Arguments**: {args_str}")
 
         if "result" in response:
             result = response["result"]
 
-            # Try to parse inner content if it exists (Standard MCP)
-            content_data = None
-            if "content" in result and isinstance(result["content"], list):
-                for item in result["content"]:
-                    if item.get("type") == "text":
-                        try:
-                            content_data = json.loads(item["text"])
-                            break
-                        except (json.JSONDecodeError, TypeError):
-                            pass
+            # Parse the inner content (Standard MCP: one text item with JSON)
+            try:
+                content_data = loads(result["content"][0]["text"])
+            except (KeyError, IndexError, TypeError, ValueError):
+                content_data = None
 
+            # Serialize exactly once, whichever branch renders it
             if content_data:
                 if "error" in content_data:
-                    self.lines.append(
-                        '- <span style="color:red;">**Tool Error**</span>:'
-                    )
-                    self.code_block(json.dumps(content_data, indent=2))
+                    label = '- <span style="color:red;">**Tool Error**</span>:'
                 else:
                     # Pretty print the parsed JSON from the tool
-                    self.lines.append("- **Result**:")
-                    self.code_block(json.dumps(content_data, indent=2))
+                    label = "- **Result**:"
+                rendered = dumps_pretty(content_data)
             else:
                 # Fallback
-                self.lines.append("- **Raw Result**:")
-                self.code_block(json.dumps(result, indent=2))
+                label = "- **Raw Result**:"
+                rendered = dumps_pretty(result)
+            self._line(label)
+            self.code_block(rendered)
 
         elif "error" in response:
-            self.lines.append('- <span style="color:red;">**RPC Error**</span>:')
-            self.code_block(json.dumps(response["error"], indent=2))
+            self._line('- <span style="color:red;">**RPC Error**</span>:')
+            self.code_block(dumps_pretty(response["error"]))
         else:
-            self.lines.append("- **Unknown Response**:")
-            self.code_block(json.dumps(response, indent=2))
+            self._line("- **Unknown Response**:")
+            self.code_block(dumps_pretty(response))
 
-        self.lines.append("---")
-        self.lines.append("")
+        self._line("---")
+        self._line()
 
     def print_report(self) -> None:
-        print("\n".join(self.lines))
+        sys.stdout.write(self.buf.getvalue())
 
 
-def run_and_report_calls(
-    reporter: MarkdownReporter,
-    mcp_client: McpSseClient,
+@dataclass
+class Section:
+    """A group of tool calls rendered under one report header."""
+
+    title: str
+    tool_name: str
+    calls: list[tuple[dict[str, Any], int]]  # (arguments, request id)
+    tool_header: str | None = None  # level-2 header emitted before this section
+
+
+def plan_calls(
+    sections: list[Section],
     req_id_counter: list[int],
     tool_name: str,
     calls: list[str | dict[str, Any]],
     section_header: str,
+    tool_header: str | None = None,
 ) -> None:
-    """Helper to run a list of tool calls and add them to the report."""
-    reporter.header(3, section_header)
+    """Helper to queue a list of tool calls for the report (sent later as one batch)."""
+    planned: list[tuple[dict[str, Any], int]] = []
     for call_info in calls:
         if isinstance(call_info, str):
             arguments = {"text": call_info}
         else:
             arguments = call_info
-
-        resp = mcp_client.request(
-            "tools/call",
-            {"name": tool_name, "arguments": arguments},
-            id=req_id_counter[0],
-        )
+        planned.append((arguments, req_id_counter[0]))
         req_id_counter[0] += 1
-        reporter.tool_call(tool_name, arguments, resp)
-        time.sleep(0.1)
+    sections.append(Section(section_header, tool_name, planned, tool_header))
+
+
+def connect_client(endpoints: Endpoints) -> McpSseClient:
+    """Open an MCP session on the server and complete the initialize handshake."""
+    from time_range_parser_lib.mcp_sse_client import McpSseClient
+
+    c = McpSseClient(endpoints.base)
+    # Override SSE URL to point to /mcp/sse since the server mounts MCP at /mcp
+    c.sse_url = endpoints.sse
+    c.connect()
+    c.request("initialize", INIT_PARAMS, id=0)
+    c.notify("notifications/initialized", {})
+    return c
+
+
+def run_section(
+    endpoints: Endpoints, section: Section, coalesce: int = 8, delay_s: float = 0.0
+) -> list[dict[str, Any]]:
+    """Run the tool calls of one section on its own MCP session.
+
+    Calls are coalesced into batches of at most `coalesce` requests. Set
+    `delay_s` to pause between batches when the server rate-limits.
+    Responses are returned in call order.
+    """
+    payloads = [
+        {
+            "jsonrpc": "2.0",
+            "id": rpc_id,
+            "method": "tools/call",
+            "params": {"name": section.tool_name, "arguments": arguments},
+        }
+        for arguments, rpc_id in section.calls
+    ]
+    responses: list[dict[str, Any]] = []
+    c = connect_client(endpoints)
+    try:
+        for i in range(0, len(payloads), coalesce):
+            if i and delay_s:
+                time.sleep(delay_s)
+            responses.extend(c.request_batch(payloads[i : i + coalesce]))
+    finally:
+        c.close()
+    return responses
+
+
+def run_and_report_calls(
+    reporter: MarkdownReporter,
+    endpoints: Endpoints,
+    sections: list[Section],
+    coalesce: int = 8,
+    delay_s: float = 0.0,
+    max_workers: int = 6,
+) -> None:
+    """Run all planned sections concurrently and add the results to the report.
+
+    Each worker uses its own McpSseClient, because an SSE session is bound to
+    a single client. Results are rendered in section order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [
+            ex.submit(run_section, endpoints, s, coalesce, delay_s) for s in sections
+        ]
+        results = [f.result() for f in futures]
+
+    for section, responses in zip(sections, results):
+        if section.tool_header:
+            reporter.header(2, section.tool_header)
+        reporter.header(3, section.title)
+        for (arguments, _), resp in zip(section.calls, responses):
+            reporter.tool_call(section.tool_name, arguments, resp)
 
 
 def main() -> None:
+    import httpx
+
+    from time_range_parser_lib.mcp_sse_client import McpSseClient
+
+    endpoints = Endpoints.from_root(SERVER_ROOT)
     reporter = MarkdownReporter()
     reporter.header(1, "MCP Client Test Report")
     reporter.text(f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
     # 0. Health Check
     reporter.header(2, "0. Health Check")
-    health_url = f"{SERVER_ROOT}/health"
+    health_url = endpoints.health
     try:
         with httpx.Client(timeout=5.0) as client:
             r = client.get(health_url)
             r.raise_for_status()
             health_data = r.json()
             reporter.text(f"✅ Health check passed: `{health_url}`")
-            reporter.code_block(json.dumps(health_data, indent=2))
+            reporter.code_block(dumps_pretty(health_data))
     except Exception as e:
         reporter.text(f"❌ Health check failed for `{health_url}`:")
         reporter.code_block(str(e), lang="text")
 
     try:
-        c = McpSseClient(SERVER_ROOT)
+        c = McpSseClient(endpoints.base)
         # Override SSE URL to point to /mcp/sse since the server mounts MCP at /mcp
-        c.sse_url = f"{SERVER_ROOT}/mcp/sse"
+        c.sse_url = endpoints.sse
         c.connect()
-        reporter.text(f"✅ Connected to `{BASE_URL}`")
+        reporter.text(f"✅ Connected to `{endpoints.mcp}`")
     except (RuntimeError, TimeoutError) as e:
         reporter.text(f"❌ Connection failed: {e}")
         reporter.print_report()
@@ -165,15 +286,7 @@ def main() -> None:
 
     # 1) Initialize
     reporter.header(2, "1. Initialization")
-    init_resp = c.request(
-        "initialize",
-        {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {},
-            "clientInfo": {"name": "mcp-client-httpx", "version": "0.2.0"},
-        },
-        id=req_id_counter[0],
-    )
+    init_resp = c.request("initialize", INIT_PARAMS, id=req_id_counter[0])
     req_id_counter[0] += 1
 
     server_info = init_resp.get("result", {}).get("serverInfo", {})
@@ -198,9 +311,9 @@ def main() -> None:
         reporter.text("No tools found.")
 
     # --- Group tests by tool and then by test file ---
+    sections: list[Section] = []
 
     # 4) Tool: resolve_time_range
-    reporter.header(2, "3. Tool: `resolve_time_range`")
 
     tests_time_range_parser = [
         "morgen",
@@ -218,13 +331,13 @@ def main() -> None:
         "1st of march",
         "29 februari",  # Leap year
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "resolve_time_range",
         tests_time_range_parser,
         "From `test_time_range_parser.py`",
+        tool_header="3. Tool: `resolve_time_range`",
     )
 
     tests_quarters_and_past = [
@@ -235,9 +348,8 @@ def main() -> None:
         "vorige maand",
         "afgelopen week",
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "resolve_time_range",
         tests_quarters_and_past,
@@ -252,9 +364,8 @@ def main() -> None:
         "H1",
         "dit weekend",
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "resolve_time_range",
         tests_vague_and_periods,
@@ -268,9 +379,8 @@ def main() -> None:
         "eerste maandag van maart",
         "laatste vrijdag van de maand",
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "resolve_time_range",
         tests_holidays,
@@ -282,9 +392,8 @@ def main() -> None:
         "binnenkort",
         "begin januari 2026",
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "resolve_time_range",
         tests_coverage_gaps,
@@ -292,40 +401,37 @@ def main() -> None:
     )
 
     # 5) Tool: expand_recurrence
-    reporter.header(2, "4. Tool: `expand_recurrence`")
     tests_recurrence = [
         {"text": "elke vrijdag", "count": 3},
         {"text": "dagelijks", "count": 3},
         {"text": "elke 2 weken", "count": 3},
         {"text": "maandelijks", "count": 2},
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "expand_recurrence",
         tests_recurrence,
         "From `test_recurrence.py`",
+        tool_header="4. Tool: `expand_recurrence`",
     )
 
     # 6) Tool: calculate_duration
-    reporter.header(2, "5. Tool: `calculate_duration`")
     tests_duration = [
         {"start": "vandaag", "end": "volgende vrijdag"},
         {"start": "vandaag", "end": "dinsdag"},
         {"start": "13:00", "end": "16:30"},
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "calculate_duration",
         tests_duration,
         "From `test_duration.py`",
+        tool_header="5. Tool: `calculate_duration`",
     )
 
     # 7) Tool: convert_timezone
-    reporter.header(2, "6. Tool: `convert_timezone`")
     tests_timezone = [
         {
             "text": "15:00",
@@ -345,23 +451,26 @@ def main() -> None:
             "target_timezone": "Mars/City",
         },
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "convert_timezone",
         tests_timezone,
         "From `test_timezone_conversion.py`",
+        tool_header="6. Tool: `convert_timezone`",
     )
 
     # 8) Tool: server_info
-    reporter.header(2, "7. Tool: `server_info`")
-    run_and_report_calls(
-        reporter, c, req_id_counter, "server_info", [{}], "Server Metadata"
+    plan_calls(
+        sections,
+        req_id_counter,
+        "server_info",
+        [{}],
+        "Server Metadata",
+        tool_header="7. Tool: `server_info`",
     )
 
     # 9) Deterministic Tests (now_iso)
-    reporter.header(2, "8. Deterministic Tests (`now_iso`)")
     tests_now_iso = [
         {
             "text": "morgen",
@@ -372,16 +481,18 @@ def main() -> None:
             "now_iso": "2026-01-01T12:00:00",
         },
     ]
-    run_and_report_calls(
-        reporter,
-        c,
+    plan_calls(
+        sections,
         req_id_counter,
         "resolve_time_range",
         tests_now_iso,
         "Fixed Reference Time (2026-01-01)",
+        tool_header="8. Deterministic Tests (`now_iso`)",
     )
 
     c.close()
+
+    run_and_report_calls(reporter, endpoints, sections)
     reporter.print_report()
 
 
@@ -1,5 +1,5 @@
 """
-MCP Client Test (using requests library) - Alternative SSE client implementation.
+MCP Client Test (raw httpx) - Alternative SSE client implementation without McpSseClient.
 
 IMPORTANT: This script requires the MCP server to be running first in SSE mode.
 
@@ -11,15 +11,30 @@ Then run this test:
 """
 
 import json
+import queue
 import sys
 import threading
-import time
 
+# orjson is optioneel: sneller (de)serialiseren, met stdlib json als fallback
 try:
-    import requests
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+
+    def dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    loads = orjson.loads
 except ImportError:
-    print("❌ Module 'requests' ontbreekt. Installeer met: uv add requests (of pip install requests)")
-    sys.exit(1)
+
+    def dumps(obj):
+        return json.dumps(obj).encode()
+
+    def dumps_pretty(obj):
+        return json.dumps(obj, indent=2)
+
+    loads = json.loads
 
 # Configuratie
 HOST = "localhost"
@@ -27,141 +42,305 @@ PORT = 9000
 BASE_URL = f"http://{HOST}:{PORT}"
 SSE_URL = f"{BASE_URL}/mcp/sse"
 
+
+def build_rpc(method, params=None, req_id=None):
+    payload = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+    if req_id is not None:
+        payload["id"] = req_id
+    return payload
+
+
+# Vaste test calls, eenmalig bij import geserialiseerd tot (id, body) paren
+_TOOL_CALLS = [
+    ("tools/list", None, 2),
+    ("tools/call", {"name": "resolve_time_range", "arguments": {"text": "tussen maandag en woensdag"}}, 3),
+    ("tools/call", {
+        "name": "convert_timezone",
+        "arguments": {"text": "15:00", "source_timezone": "Amsterdam", "target_timezone": "New York"}
+    }, 4),
+    ("tools/call", {
+        "name": "expand_recurrence",
+        "arguments": {"text": "elke 2 weken", "count": 3}
+    }, 5),
+    ("tools/call", {
+        "name": "calculate_duration",
+        "arguments": {"start": "vandaag", "end": "volgende week vrijdag"}
+    }, 6),
+]
+
+# Handshake berichten, eveneens vooraf geserialiseerd
+INITIALIZE_PAYLOAD = dumps(build_rpc("initialize", {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {"name": "python-test", "version": "1.0"}
+}, 1))
+INITIALIZED_PAYLOAD = dumps(build_rpc("notifications/initialized"))
+
+TOOL_CALL_PAYLOADS = [
+    (req_id, dumps(build_rpc(method, params, req_id)))
+    for method, params, req_id in _TOOL_CALLS
+]
+
+# 20 Challenging test calls
+CHALLENGES = [
+    "morgen half 3",                   # NL tijdnotatie
+    "tussen maandag en woensdag",      # Dag range
+    "van 22:00 tot 02:00",             # Midnight crossing
+    "eerste maandag van maart",        # Ordinaal
+    "Q3 2025",                         # Kwartaal
+    "afgelopen jaar",                  # Verleden periode
+    "pasen 2026",                      # Feestdag
+    "next friday from 2 to 4 pm",      # Engels complex
+    "3 dagen",                         # Duur
+    "kwart voor 5",                    # NL tijdnotatie
+    "vorig jaar",                      # Verleden
+    "deze week",                       # Huidige periode
+    "overmorgen 9 uur",                # Relatief + tijd
+    "tussen 14:00 en 15:30",           # Range syntax
+    "last friday",                     # Engels verleden
+    "tweede kerstdag",                 # Feestdag
+    "laatste vrijdag van de maand",    # Ordinaal relatief
+    "van 9 tot 17 uur",                # Werkdag
+    "komende donderdag",               # Relatief weekdag
+    "15-03-2026"                       # Expliciet
+]
+
+CHALLENGE_PAYLOADS = [
+    (req_id, dumps(build_rpc("tools/call", {
+        "name": "resolve_time_range",
+        "arguments": {"text": text}
+    }, req_id)))
+    for req_id, text in enumerate(CHALLENGES, start=10)
+]
+
+
+def iter_sse_lines(chunks):
+    """
+    Splits een stroom van byte-chunks in regels.
+
+    Alleen de nieuw ontvangen chunk wordt op newlines doorzocht; een regel die
+    over meerdere chunks loopt wordt pas bij de afsluitende newline één keer
+    samengevoegd. Zo groeit het werk met het aantal bytes, niet met
+    chunks * bytes zoals bij het herhaald herscannen van een buffer.
+    """
+    pending = []
+    for chunk in chunks:
+        start = 0
+        while (idx := chunk.find(b"\n", start)) != -1:
+            line = chunk[start:idx]
+            if pending:
+                pending.append(line)
+                line = b"".join(pending)
+                pending = []
+            yield line.rstrip(b"\r")
+            start = idx + 1
+        if start < len(chunk):
+            pending.append(chunk[start:])
+    if pending:
+        yield b"".join(pending).rstrip(b"\r")
+
+
+def iter_sse_events(lines):
+    """
+    Groepeert SSE regels tot events en levert (event, data) paren als bytes.
+
+    Een event eindigt bij een lege regel; meerdere "data:" regels binnen één
+    event worden met een newline samengevoegd (zoals de SSE spec voorschrijft).
+    Zo gaat er geen event verloren als de server (of een proxy) meerdere events
+    in één chunk verstuurt.
+    """
+    event = b"message"
+    data_lines = []
+    for line in lines:
+        if not line:
+            if data_lines:
+                yield event, data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+            event = b"message"
+            data_lines = []
+            continue
+
+        # Velden splitsen op de ruwe bytes met één partition();
+        # alleen de payload wordt (door loads) gedecodeerd.
+        field, sep, value = line.partition(b":")
+        if not sep or not field:  # geen veld of commentaarregel
+            continue
+        if value.startswith(b" "):
+            value = value[1:]
+        if field == b"data":
+            data_lines.append(value)
+        elif field == b"event":
+            event = value
+    # Een onafgemaakt event aan het eind van de stream wordt (volgens spec) genegeerd
+
+
+# Voortgangsmeldingen gaan via een queue naar een aparte schrijf-thread, zodat
+# de stdout flush niet in de verzend- en SSE-lussen zit.
+_log_q = queue.SimpleQueue()
+
+
+def log(msg):
+    _log_q.put(msg)
+
+
+def _log_writer():
+    for msg in iter(_log_q.get, None):
+        print(msg)
+
+
+def start_log_writer():
+    thread = threading.Thread(target=_log_writer, daemon=True)
+    thread.start()
+    return thread
+
+
+def stop_log_writer(thread):
+    """Leeg de queue en stop de schrijf-thread."""
+    _log_q.put(None)
+    thread.join()
+
+
 def main():
-    print(f"🔵 Starten van MCP flow test op {BASE_URL}...")
+    # httpx pas hier importeren, zodat het laden van deze module goedkoop blijft
+    try:
+        import httpx
+    except ImportError:
+        print("❌ Module 'httpx' ontbreekt. Installeer met: uv add httpx (of pip install httpx)")
+        sys.exit(1)
+
+    log_thread = start_log_writer()
+    log(f"🔵 Starten van MCP flow test op {BASE_URL}...")
     
+    # Eén (thread-safe) client met keep-alive connection pool voor de SSE stream
+    # en alle POSTs. De server (uvicorn) spreekt alleen HTTP/1.1, dus de stream
+    # en de POSTs lopen over aparte verbindingen uit dezelfde pool.
+    client = httpx.Client(headers={"Content-Type": "application/json"}, timeout=30.0)
+
     # 1. Start SSE Listener in een aparte thread
     session_data = {"endpoint": None}
     stop_event = threading.Event()
-    
+    endpoint_ready = threading.Event()
+
+    # JSON-RPC responses die via SSE binnenkomen, gecorreleerd op id
+    responses = {}
+    responses_cond = threading.Condition()
+
+    # De listener blokkeert in een socket read (geparkeerd door de kernel, geen
+    # CPU tijdens idle). Bij afsluiten sluiten we de stream zodat de thread
+    # direct wakker wordt en stopt i.p.v. te blijven hangen tot de volgende event.
+    sse_response = None
+
     def listen_sse():
+        nonlocal sse_response
         try:
-            print(f"🎧 Verbinden met SSE stream: {SSE_URL}")
-            with requests.get(SSE_URL, stream=True) as response:
+            log(f"🎧 Verbinden met SSE stream: {SSE_URL}")
+            # Geen read timeout: de stream mag lang idle zijn
+            with client.stream("GET", SSE_URL, timeout=httpx.Timeout(30.0, read=None)) as response:
+                sse_response = response
                 response.raise_for_status()
-                for line in response.iter_lines():
+                for event, payload in iter_sse_events(iter_sse_lines(response.iter_bytes())):
                     if stop_event.is_set():
                         break
-                    
-                    if line:
-                        decoded = line.decode('utf-8')
-                        
-                        # MCP SSE format:
-                        # event: endpoint
-                        # data: /messages/?session_id=...
-                        if decoded.startswith("data:") and "session_id=" in decoded:
-                            endpoint = decoded.replace("data:", "").strip()
+
+                    # MCP SSE format:
+                    # event: endpoint
+                    # data: /messages/?session_id=...
+                    if event == b"endpoint":
+                        if not session_data["endpoint"]:
+                            endpoint = payload.decode("utf-8")
                             session_data["endpoint"] = endpoint
-                            print(f"✅ Session Endpoint ontvangen: {endpoint}")
-                        
-                        # Print JSON-RPC responses
-                        elif decoded.startswith("data:") and session_data["endpoint"]:
-                            content = decoded.replace("data:", "").strip()
-                            try:
-                                data = json.loads(content)
-                                print(f"\n📩 Response ontvangen:\n{json.dumps(data, indent=2)}")
-                            except json.JSONDecodeError:
-                                pass
+                            endpoint_ready.set()
+                            log(f"✅ Session Endpoint ontvangen: {endpoint}")
+
+                    # Print JSON-RPC responses
+                    else:
+                        try:
+                            data = loads(payload)
+                            log(f"\n📩 Response ontvangen:\n{dumps_pretty(data)}")
+                        except ValueError:  # JSONDecodeError of ongeldige UTF-8
+                            continue
+                        if isinstance(data, dict) and "id" in data:
+                            with responses_cond:
+                                responses[data["id"]] = data
+                                responses_cond.notify_all()
         except Exception as e:
-            print(f"❌ SSE Error: {e}")
+            if not stop_event.is_set():
+                log(f"❌ SSE Error: {e}")
+
+    def stop_listener():
+        stop_event.set()
+        if sse_response is not None:
+            sse_response.close()
+        thread.join(timeout=1)
 
     thread = threading.Thread(target=listen_sse, daemon=True)
     thread.start()
 
     # 2. Wacht op session ID
-    print("⏳ Wachten op session ID...")
-    timeout = 10
-    start = time.time()
-    while not session_data["endpoint"]:
-        if time.time() - start > timeout:
-            print("❌ Timeout: Geen session ID ontvangen.")
-            stop_event.set()
-            return
-        time.sleep(0.1)
+    log("⏳ Wachten op session ID...")
+    if not endpoint_ready.wait(timeout=10):
+        log("❌ Timeout: Geen session ID ontvangen.")
+        stop_listener()
+        client.close()
+        stop_log_writer(log_thread)
+        return
 
     messages_url = f"{BASE_URL}{session_data['endpoint']}"
     
-    def send_rpc(method, params=None, req_id=None):
-        payload = {"jsonrpc": "2.0", "method": method, "params": params or {}}
-        if req_id is not None:
-            payload["id"] = req_id
-        print(f"📤 Sending {method} (id={req_id})...")
+    def post_rpc(body):
+        # Alleen bij een foutstatus een exception opbouwen
+        r = client.post(messages_url, content=body)
+        if r.status_code >= 400:
+            r.raise_for_status()
+
+    def send_rpc(method, body, req_id=None):
+        """Verstuur één vooraf geserialiseerd bericht."""
+        log(f"📤 Sending {method} (id={req_id})...")
         try:
-            requests.post(messages_url, json=payload).raise_for_status()
+            post_rpc(body)
         except Exception as e:
-            print(f"❌ POST Error: {e}")
+            log(f"❌ POST Error: {e}")
+
+    def send_rpc_batch(payloads):
+        """
+        Verstuur een reeks vooraf geserialiseerde (id, body) calls direct achter elkaar.
+
+        De MCP SSE transport accepteert per POST precies één JSON-RPC bericht
+        (geen JSON-RPC batch array), dus we pipelinen de POSTs zonder pauzes en
+        correleren de antwoorden daarna via het `id` veld op de SSE stream.
+        """
+        if not session_data["endpoint"]:
+            log("❌ Geen session endpoint, batch niet verstuurd.")
+            return []
+        log(f"📤 Sending batch van {len(payloads)} calls...")
+        for req_id, body in payloads:
+            try:
+                post_rpc(body)
+            except Exception as e:
+                log(f"❌ POST Error (id={req_id}): {e}")
+        return [req_id for req_id, _ in payloads]
+
+    def wait_for_responses(ids, timeout=10):
+        """Wacht tot alle responses voor `ids` binnen zijn (of timeout)."""
+        pending = set(ids)
+        with responses_cond:
+            ok = responses_cond.wait_for(lambda: pending <= responses.keys(), timeout=timeout)
+        if not ok:
+            missing = sorted(pending - responses.keys())
+            log(f"⚠️ Timeout: geen response voor id(s) {missing}")
+        return ok
 
     # 3. Voer de flow uit
-    send_rpc("initialize", {
-        "protocolVersion": "2024-11-05",
-        "capabilities": {},
-        "clientInfo": {"name": "python-test", "version": "1.0"}
-    }, req_id=1)
-    
-    time.sleep(0.5)
-    send_rpc("notifications/initialized")
-    
-    time.sleep(0.5)
-    send_rpc("tools/list", req_id=2)
-    
-    time.sleep(0.5)
-    send_rpc("tools/call", {"name": "resolve_time_range", "arguments": {"text": "tussen maandag en woensdag"}}, req_id=3)
-    
-    time.sleep(0.5)
-    send_rpc("tools/call", {
-        "name": "convert_timezone", 
-        "arguments": {"text": "15:00", "source_timezone": "Amsterdam", "target_timezone": "New York"}
-    }, req_id=4)
-    
-    time.sleep(0.5)
-    send_rpc("tools/call", {
-        "name": "expand_recurrence", 
-        "arguments": {"text": "elke 2 weken", "count": 3}
-    }, req_id=5)
-    
-    time.sleep(0.5)
-    send_rpc("tools/call", {
-        "name": "calculate_duration", 
-        "arguments": {"start": "vandaag", "end": "volgende week vrijdag"}
-    }, req_id=6)
-    
-    # 20 Challenging test calls
-    challenges = [
-        "morgen half 3",                   # NL tijdnotatie
-        "tussen maandag en woensdag",      # Dag range
-        "van 22:00 tot 02:00",             # Midnight crossing
-        "eerste maandag van maart",        # Ordinaal
-        "Q3 2025",                         # Kwartaal
-        "afgelopen jaar",                  # Verleden periode
-        "pasen 2026",                      # Feestdag
-        "next friday from 2 to 4 pm",      # Engels complex
-        "3 dagen",                         # Duur
-        "kwart voor 5",                    # NL tijdnotatie
-        "vorig jaar",                      # Verleden
-        "deze week",                       # Huidige periode
-        "overmorgen 9 uur",                # Relatief + tijd
-        "tussen 14:00 en 15:30",           # Range syntax
-        "last friday",                     # Engels verleden
-        "tweede kerstdag",                 # Feestdag
-        "laatste vrijdag van de maand",    # Ordinaal relatief
-        "van 9 tot 17 uur",                # Werkdag
-        "komende donderdag",               # Relatief weekdag
-        "15-03-2026"                       # Expliciet
-    ]
-
-    time.sleep(2)
-    req_id = 10
-    for text in challenges:
-        send_rpc("tools/call", {
-            "name": "resolve_time_range",
-            "arguments": {"text": text}
-        }, req_id=req_id)
-        req_id += 1
-        time.sleep(0.1)
-
-    time.sleep(3)
-    stop_event.set()
-    print("🏁 Test klaar.")
+    # Handshake blijft serieel (vereist door MCP)
+    send_rpc("initialize", INITIALIZE_PAYLOAD, req_id=1)
+    wait_for_responses([1])
+    send_rpc("notifications/initialized", INITIALIZED_PAYLOAD)
+
+    ids = send_rpc_batch(TOOL_CALL_PAYLOADS + CHALLENGE_PAYLOADS)
+    wait_for_responses(ids)
+    stop_listener()
+    client.close()
+    log("🏁 Test klaar.")
+    stop_log_writer(log_thread)
 
 if __name__ == "__main__":
     main()
@@ -13,14 +13,8 @@ Then run this example:
 
 import json
 import sys
-import os
 from datetime import datetime
 
-# Zorg dat we src/lib kunnen vinden
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
-
-from lib.mcp_sse_client import McpSseClient
-
 # Configuratie
 HOST = "localhost"
 PORT = 9000
@@ -98,6 +92,9 @@ def main():
         user_query = "Hoeveel omzet draaiden we vorig kwartaal?"
 
     try:
+        # Pas hier importeren: httpx laden kost merkbaar opstarttijd
+        from time_range_parser_lib.mcp_sse_client import McpSseClient
+
         # McpSseClient handelt de SSE connectie en handshake af in __enter__
         client = McpSseClient(BASE_URL)
         # Override SSE URL to point to /mcp/sse since the server mounts MCP at /mcp
@@ -1,9 +1,13 @@
 from __future__ import annotations
+import functools
 import logging
 import os
 import sys
-from typing import Any
-import re
+from datetime import datetime as dt_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, TypedDict
 from importlib.metadata import version, PackageNotFoundError
 
 from mcp.server.fastmcp import FastMCP
@@ -15,20 +19,16 @@ from date_textparser import (
     calculate_duration,
     DEFAULT_TZ,
 )
-from date_textparser.core import normalize_timezone
-from date_textparser.vocabulary import TIMEZONE_ALIASES
-
-# Ensure src is in path to import lib.external_time
-src_path = os.path.join(os.path.dirname(__file__), "src")
-if src_path not in sys.path:
-    sys.path.append(src_path)
-from lib.external_time import (
+from date_textparser.core import normalize_timezone, warm_up
+from time_range_parser_lib.external_time import (
     get_current_time_from_api,
     get_local_timezone_from_ip,
     get_time_info_from_api,
     get_ip_info,
+    is_api_enabled,
 )
 
+
 # Configure logging to stderr (important for MCP stdio)
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
@@ -43,7 +43,18 @@ mcp = FastMCP("time-range-parser")
 # This will hold the effective default timezone, which can be updated at startup.
 _effective_default_tz = DEFAULT_TZ
 
+# Worker threads for overlapping blocking WorldTimeAPI calls (created lazily)
+_external_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="external-time")
+
+
+class HealthStatus(TypedDict):
+    """Payload of the /health endpoint (SSE/HTTP transport)."""
+
+    status: str
+    version: str
 
+
+@functools.cache
 def get_app_version() -> str:
     try:
         return version("time-range-parser")
@@ -63,20 +74,42 @@ CUSTOM_EVENTS = {
 }
 
 
-def check_custom_events(text: str) -> dict[str, Any] | None:
+# Result fields per normalized event key, built once at import.
+# Simple implementation: return the date as start/end
+# Ideally, parse the value to ensure ISO format
+_CUSTOM_EVENT_RESULTS: dict[str, dict[str, str]] = {
+    k.lower(): {
+        "start": f"{v}T00:00:00",
+        "end": f"{v}T23:59:59",
+        "kind": "custom_event",
+    }
+    for k, v in CUSTOM_EVENTS.items()
+}
+
+
+# Tool inputs repeat a lot, so the lookup below is memoized. CUSTOM_EVENTS is
+# static after import, so the cache never needs invalidation.
+@functools.lru_cache(maxsize=512)
+def _lookup_custom_event(text: str) -> dict[str, str] | None:
+    return _CUSTOM_EVENT_RESULTS.get(normalize_text(text))
+
+
+def normalize_text(text: str) -> str:
+    """Trimmed, unquoted, lowercase view of tool input, shared by the helpers below."""
+    return text.strip().strip("'\"").lower()
+
+
+def check_custom_events(
+    text: str, text_norm: str | None = None
+) -> dict[str, Any] | None:
     """Check if text matches a known custom event."""
-    key = text.strip().strip("'\"").lower()
-    if key in CUSTOM_EVENTS:
-        # Simple implementation: return the date as start/end
-        # Ideally, parse the value to ensure ISO format
-        val = CUSTOM_EVENTS[key]
-        return {
-            "input": text,
-            "timezone": DEFAULT_TZ,
-            "start": f"{val}T00:00:00",
-            "end": f"{val}T23:59:59",
-            "kind": "custom_event",
-        }
+    if text_norm is not None:
+        base = _CUSTOM_EVENT_RESULTS.get(text_norm)
+    else:
+        base = _lookup_custom_event(text)
+    if base is not None:
+        # Fresh dict: callers may override fields
+        return {"input": text, "timezone": DEFAULT_TZ, **base}
     return None
 
 
@@ -89,7 +122,20 @@ def _resolve_context(
     Fallback strategy:
     - If USE_WORLDTIME_API is False (or fails), we rely on DEFAULT_TZ and system time.
     - TIMEZONE_ALIASES are used for normalization (static list if API is off).
+
+    Both steps are cached on their own: normalization per raw input (lru_cache),
+    and 'now' per timezone in time_range_parser_lib.external_time, which keeps the
+    clock running from a recent fetch. A single TTL cache over the pair would
+    freeze 'now'.
     """
+    # When both lookups are needed, fetch 'now' for the default timezone while the
+    # IP lookup runs. The default is usually the IP-detected zone (set at startup).
+    speculative_now: Future[str | None] | None = None
+    if timezone is None and now_iso is None and is_api_enabled():
+        speculative_now = _external_pool.submit(
+            get_current_time_from_api, _effective_default_tz
+        )
+
     # 1. Resolve Timezone
     if timezone is None:
         timezone = get_local_timezone_from_ip()
@@ -101,23 +147,71 @@ def _resolve_context(
     final_tz = timezone or _effective_default_tz
 
     # 2. Resolve Now
-    if now_iso is None:
+    if speculative_now is not None and final_tz == _effective_default_tz:
+        now_iso = speculative_now.result()
+    elif now_iso is None:
+        if speculative_now is not None:
+            speculative_now.cancel()
         now_iso = get_current_time_from_api(final_tz)
 
     return final_tz, now_iso
 
 
-def analyze_error_hint(text: str) -> str | None:
-    """Analyze input to provide smart error hints (Point C)."""
+def _has_bad_quarter(t: str) -> bool:
+    """True if lowercased text contains 'q' directly followed by 5-9."""
+    i = t.find("q")
+    while i != -1:
+        if t[i + 1 : i + 2] in ("5", "6", "7", "8", "9"):
+            return True
+        i = t.find("q", i + 1)
+    return False
+
+
+def _has_bad_week(t: str) -> bool:
+    """True if lowercased text contains 'week' followed by a number above 53."""
+    n = len(t)
+    i = t.find("week")
+    while i != -1:
+        j = i + 4
+        while j < n and t[j].isspace():
+            j += 1
+        k = j
+        while k < n and t[k].isdecimal():
+            k += 1
+        if k > j and int(t[j:k]) > 53:
+            return True
+        i = t.find("week", i + 1)
+    return False
+
+
+def analyze_error_hint(text: str, *, normalized: bool = False) -> str | None:
+    """
+    Analyze input to provide smart error hints (Point C).
+
+    Pass `normalized=True` when `text` is already lowercased (see normalize_text).
+    """
+    t = text if normalized else text.lower()
     # Check for invalid quarters (Q5-Q9)
-    if re.search(r"q[5-9]", text, re.IGNORECASE):
+    if _has_bad_quarter(t):
         return "Invalid quarter detected. Quarters must be between Q1 and Q4."
     # Check for invalid week numbers (>53)
-    if re.search(r"week\s*([6-9]\d|[1-9]\d{2,})", text, re.IGNORECASE):
+    if _has_bad_week(t):
         return "Invalid week number. Weeks must be between 1 and 53."
     return None
 
 
+def _iso_seconds(dt: dt_datetime) -> str:
+    """
+    ISO-8601 at second resolution, same output as
+    `dt.set(microsecond=0).to_iso8601_string()` without building a new DateTime.
+    """
+    iso = dt_datetime.isoformat(dt, timespec="seconds")
+    # pendulum writes the UTC zone as 'Z'
+    if getattr(dt.tzinfo, "name", None) == "UTC":
+        iso = iso[:-6] + "Z"
+    return iso
+
+
 @mcp.tool(name="resolve_time_range")
 def resolve_time_range(
     text: str,
@@ -142,11 +236,16 @@ def resolve_time_range(
     """
     final_tz, final_now_iso = _resolve_context(timezone, now_iso)
     logger.info(
-        f"Tool 'resolve_time_range' called: text='{text}', timezone='{final_tz}', fiscal_start={fiscal_start_month}"
+        "Tool 'resolve_time_range' called: text='%s', timezone='%s', fiscal_start=%s",
+        text,
+        final_tz,
+        fiscal_start_month,
     )
 
+    text_norm = normalize_text(text)
+
     # 1. Check Custom Events (Point B)
-    custom_result = check_custom_events(text)
+    custom_result = check_custom_events(text, text_norm)
     if custom_result:
         custom_result["timezone"] = final_tz  # Override default if needed
         return custom_result
@@ -162,16 +261,16 @@ def resolve_time_range(
         return {
             "input": text,
             "timezone": result.timezone,
-            "start": result.start.set(microsecond=0).to_iso8601_string(),
-            "end": result.end.set(microsecond=0).to_iso8601_string(),
+            "start": _iso_seconds(result.start),
+            "end": _iso_seconds(result.end),
             "kind": result.assumptions.get("kind"),
         }
     except Exception as e:
         # 2. Smart Error Responses (Point C)
-        hint = analyze_error_hint(text)
+        hint = analyze_error_hint(text_norm, normalized=True)
         error_msg = f"{str(e)} - Hint: {hint}" if hint else str(e)
 
-        logger.error(f"Error parsing '{text}': {error_msg}")
+        logger.error("Error parsing '%s': %s", text, error_msg)
         return {"error": error_msg, "input": text}
 
 
@@ -189,7 +288,10 @@ def convert_timezone(
     final_source_tz, final_now_iso = _resolve_context(source_timezone, now_iso)
     final_target_tz = normalize_timezone(target_timezone)
     logger.info(
-        f"Tool 'convert_timezone' called: text='{text}', from='{final_source_tz}' to='{final_target_tz}'"
+        "Tool 'convert_timezone' called: text='%s', from='%s' to='%s'",
+        text,
+        final_source_tz,
+        final_target_tz,
     )
     try:
         return core_convert_to_timezone(
@@ -199,7 +301,7 @@ def convert_timezone(
             now_iso=final_now_iso,
         )
     except Exception as e:
-        logger.error(f"Error converting timezone: {e}")
+        logger.error("Error converting timezone: %s", e)
         return {"error": str(e)}
 
 
@@ -216,14 +318,17 @@ def expand_recurrence_tool(
     """
     final_tz, final_now_iso = _resolve_context(timezone, now_iso)
     logger.info(
-        f"Tool 'expand_recurrence' called: text='{text}', count={count}, timezone='{final_tz}'"
+        "Tool 'expand_recurrence' called: text='%s', count=%s, timezone='%s'",
+        text,
+        count,
+        final_tz,
     )
     try:
         return expand_recurrence(
             text=text, tz=final_tz, now_iso=final_now_iso, count=count
         )
     except Exception as e:
-        logger.error(f"Error expanding recurrence: {e}")
+        logger.error("Error expanding recurrence: %s", e)
         return {"error": str(e)}
 
 
@@ -240,14 +345,17 @@ def calculate_duration_tool(
     """
     final_tz, final_now_iso = _resolve_context(timezone, now_iso)
     logger.info(
-        f"Tool 'calculate_duration' called: start='{start}', end='{end}', timezone='{final_tz}'"
+        "Tool 'calculate_duration' called: start='%s', end='%s', timezone='%s'",
+        start,
+        end,
+        final_tz,
     )
     try:
         return calculate_duration(
             start_text=start, end_text=end, tz=final_tz, now_iso=final_now_iso
         )
     except Exception as e:
-        logger.error(f"Error calculating duration: {e}")
+        logger.error("Error calculating duration: %s", e)
         return {"error": str(e)}
 
 
@@ -258,7 +366,7 @@ def get_dst_status(timezone: str | None = None) -> dict[str, Any]:
     Returns whether DST is active, and when the next transition occurs.
     """
     final_tz, _ = _resolve_context(timezone, None)
-    logger.info(f"Tool 'get_dst_status' called for timezone='{final_tz}'")
+    logger.info("Tool 'get_dst_status' called for timezone='%s'", final_tz)
 
     info = get_time_info_from_api(final_tz)
     if not info:
@@ -282,7 +390,7 @@ def get_calendar_info(timezone: str | None = None) -> dict[str, Any]:
     Useful for business logic (e.g. 'What week is it?').
     """
     final_tz, _ = _resolve_context(timezone, None)
-    logger.info(f"Tool 'get_calendar_info' called for timezone='{final_tz}'")
+    logger.info("Tool 'get_calendar_info' called for timezone='%s'", final_tz)
 
     info = get_time_info_from_api(final_tz)
     if not info:
@@ -304,18 +412,13 @@ def get_world_time(city: str) -> dict[str, Any]:
     Get the current time for a specific city or timezone via WorldTimeAPI.
     Example: city="New York" -> returns current time in America/New_York.
     """
-    use_worldtime_api = os.environ.get("USE_WORLDTIME_API", "false").lower() in (
-        "true",
-        "1",
-        "yes",
-    )
-    if not use_worldtime_api:
+    if not is_api_enabled():
         logger.warning(
             "Tool 'get_world_time' called, but WorldTimeAPI is disabled by server configuration."
         )
         return {"error": "WorldTimeAPI is disabled by server configuration."}
 
-    logger.info(f"Tool 'get_world_time' called: city='{city}'")
+    logger.info("Tool 'get_world_time' called: city='%s'", city)
     try:
         # 1. Normalize to IANA timezone (e.g. "London" -> "Europe/London")
         timezone = normalize_timezone(city)
@@ -340,10 +443,39 @@ def get_world_time(city: str) -> dict[str, Any]:
                 "error": f"Could not fetch time for '{city}' (timezone: '{timezone}'). API might be down or timezone invalid."
             }
     except Exception as e:
-        logger.error(f"Error in get_world_time: {e}")
+        logger.error("Error in get_world_time: %s", e)
         return {"error": str(e)}
 
 
+# Static part of the server_info payload, built once (read-only, nested levels too)
+_SERVER_CAPABILITIES: Mapping[str, bool] = MappingProxyType(
+    {
+        "natural_language_parsing": True,
+        "recurrence_expansion": True,
+        "timezone_conversion": True,
+        "duration_calculation": True,
+        "dst_awareness": True,
+        "calendar_info": True,
+    }
+)
+_SERVER_INFO_STATIC: Mapping[str, Any] = MappingProxyType(
+    {
+        "resolution": "seconds",
+        "capabilities": _SERVER_CAPABILITIES,
+        "tools": (
+            "resolve_time_range",
+            "convert_timezone",
+            "expand_recurrence",
+            "calculate_duration",
+            "get_dst_status",
+            "get_calendar_info",
+            "get_world_time",
+            "server_info",
+        ),
+    }
+)
+
+
 @mcp.tool(name="server_info")
 def server_info() -> dict[str, Any]:
     """Basic server info for clients."""
@@ -358,36 +490,15 @@ def server_info() -> dict[str, Any]:
         "description": "Natural language date/time range parser for Dutch and English",
         "default_timezone": detected_tz or _effective_default_tz,
         "public_ip": client_ip,
-        "resolution": "seconds",
-        "capabilities": {
-            "natural_language_parsing": True,
-            "recurrence_expansion": True,
-            "timezone_conversion": True,
-            "duration_calculation": True,
-            "dst_awareness": True,
-            "calendar_info": True,
-        },
-        "tools": [
-            "resolve_time_range",
-            "convert_timezone",
-            "expand_recurrence",
-            "calculate_duration",
-            "get_dst_status",
-            "get_calendar_info",
-            "get_world_time",
-            "server_info",
-        ],
+        **_SERVER_INFO_STATIC,
+        # Plain dict per response (same key position); the proxy is not JSON
+        "capabilities": dict(_SERVER_CAPABILITIES),
     }
 
 
 if __name__ == "__main__":
     # Check for WorldTimeAPI usage at startup
-    use_worldtime_api = os.environ.get("USE_WORLDTIME_API", "false").lower() in (
-        "true",
-        "1",
-        "yes",
-    )
-    if use_worldtime_api:
+    if is_api_enabled():
         logger.info(
             "USE_WORLDTIME_API is true. Attempting to detect local timezone from public IP..."
         )
@@ -403,6 +514,9 @@ if __name__ == "__main__":
                 f"Could not detect timezone from WorldTimeAPI. Using default '{_effective_default_tz}'."
             )
 
+    # Load dateparser and its locale data before the first request arrives
+    warm_up()
+
     # Determine transport type
     transport_type = os.environ.get("TRANSPORT_TYPE", "stdio").lower()
 
@@ -423,53 +537,56 @@ if __name__ == "__main__":
         )
 
         @app.get("/health")
-        async def health_check() -> dict[str, Any]:
+        async def health_check() -> HealthStatus:
             """Health check endpoint to verify server status."""
             return {"status": "online", "version": get_app_version()}
 
+        # The page only depends on the (cached) version, so render and encode it once
+        app_version = get_app_version()
+        root_html = f"""
+        <!DOCTYPE html>
+        <html lang="en">
+            <head>
+                <meta charset="UTF-8">
+                <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                <title>Time Range Parser MCP Server</title>
+                <style>
+                    body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif; margin: 0; padding: 0; background-color: #f8f9fa; color: #212529; }}
+                    .container {{ max-width: 800px; margin: 2em auto; padding: 2em; background-color: #fff; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.05); }}
+                    h1 {{ color: #005a9c; }}
+                    h2 {{ color: #343a40; border-bottom: 2px solid #dee2e6; padding-bottom: 0.3em; margin-top: 1.5em;}}
+                    code {{ background-color: #e9ecef; padding: 0.2em 0.4em; border-radius: 3px; font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace; }}
+                    ul {{ list-style-type: none; padding: 0; }}
+                    li {{ background-color: #f8f9fa; margin: 0.5em 0; padding: 1em; border: 1px solid #dee2e6; border-radius: 5px; display: flex; align-items: center; }}
+                    a {{ color: #007bff; text-decoration: none; font-weight: 500; }}
+                    a:hover {{ text-decoration: underline; }}
+                    .description {{ color: #6c757d; margin-left: 1em; }}
+                </style>
+            </head>
+            <body>
+                <div class="container">
+                    <h1>Time Range Parser MCP Server</h1>
+                    <p>Version: <strong>{app_version}</strong></p>
+                    <p>This server provides natural language date/time parsing services via the <strong>MCP (Multi-purpose Communication Protocol)</strong>.</p>
+                    <h2>Available Endpoints</h2>
+                    <ul>
+                        <li><a href="/docs"><code>/docs</code></a><span class="description">&mdash; OpenAPI (Swagger) documentation for REST endpoints.</span></li>
+                        <li><a href="/redoc"><code>/redoc</code></a><span class="description">&mdash; Alternative ReDoc documentation.</span></li>
+                        <li><a href="/health"><code>/health</code></a><span class="description">&mdash; Health check endpoint. Returns server status and version.</span></li>
+                        <li><code>/mcp/sse</code><span class="description">&mdash; The main Server-Sent Events (SSE) endpoint for establishing an MCP session.</li>
+                    </ul>
+                    <h2>Usage</h2>
+                    <p>To interact with the server, connect to the <code>/mcp/sse</code> endpoint with an MCP-compatible client. The server will provide a unique URL for posting messages.</p>
+                </div>
+            </body>
+        </html>
+        """.encode()
+        root_headers = {"Cache-Control": "public, max-age=3600"}
+
         @app.get("/", response_class=responses.HTMLResponse, include_in_schema=False)
         async def root_info():
             """Provides a simple HTML page with information about the server and its endpoints."""
-            version = get_app_version()
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-                <head>
-                    <meta charset="UTF-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                    <title>Time Range Parser MCP Server</title>
-                    <style>
-                        body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif; margin: 0; padding: 0; background-color: #f8f9fa; color: #212529; }}
-                        .container {{ max-width: 800px; margin: 2em auto; padding: 2em; background-color: #fff; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.05); }}
-                        h1 {{ color: #005a9c; }}
-                        h2 {{ color: #343a40; border-bottom: 2px solid #dee2e6; padding-bottom: 0.3em; margin-top: 1.5em;}}
-                        code {{ background-color: #e9ecef; padding: 0.2em 0.4em; border-radius: 3px; font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace; }}
-                        ul {{ list-style-type: none; padding: 0; }}
-                        li {{ background-color: #f8f9fa; margin: 0.5em 0; padding: 1em; border: 1px solid #dee2e6; border-radius: 5px; display: flex; align-items: center; }}
-                        a {{ color: #007bff; text-decoration: none; font-weight: 500; }}
-                        a:hover {{ text-decoration: underline; }}
-                        .description {{ color: #6c757d; margin-left: 1em; }}
-                    </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <h1>Time Range Parser MCP Server</h1>
-                        <p>Version: <strong>{version}</strong></p>
-                        <p>This server provides natural language date/time parsing services via the <strong>MCP (Multi-purpose Communication Protocol)</strong>.</p>
-                        <h2>Available Endpoints</h2>
-                        <ul>
-                            <li><a href="/docs"><code>/docs</code></a><span class="description">&mdash; OpenAPI (Swagger) documentation for REST endpoints.</span></li>
-                            <li><a href="/redoc"><code>/redoc</code></a><span class="description">&mdash; Alternative ReDoc documentation.</span></li>
-                            <li><a href="/health"><code>/health</code></a><span class="description">&mdash; Health check endpoint. Returns server status and version.</span></li>
-                            <li><code>/mcp/sse</code><span class="description">&mdash; The main Server-Sent Events (SSE) endpoint for establishing an MCP session.</li>
-                        </ul>
-                        <h2>Usage</h2>
-                        <p>To interact with the server, connect to the <code>/mcp/sse</code> endpoint with an MCP-compatible client. The server will provide a unique URL for posting messages.</p>
-                    </div>
-                </body>
-            </html>
-            """
-            return responses.HTMLResponse(content=html_content)
+            return responses.HTMLResponse(content=root_html, headers=root_headers)
 
         # Mount the MCP application onto the /mcp path
         app.mount("/mcp", mcp.sse_app())
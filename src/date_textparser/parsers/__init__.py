@@ -26,6 +26,7 @@ from .periods import (
     parse_season,
     parse_month_expr,
     parse_weekend,
+    match_period_directions,
     parse_past_period,
     parse_future_period,
     parse_year_boundary,
@@ -78,6 +79,7 @@ __all__ = [
     "parse_season",
     "parse_month_expr",
     "parse_weekend",
+    "match_period_directions",
     "parse_past_period",
     "parse_future_period",
     "parse_year_boundary",
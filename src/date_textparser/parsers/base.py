@@ -4,12 +4,16 @@ Base helper functions for date/time parsing.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from datetime import timedelta
+from operator import methodcaller
+from typing import Callable
 
 import pendulum
 
-from ..vocabulary import PERIOD_UNITS
+from ..vocabulary import DURATION_UNITS, PERIOD_UNITS
 from ..patterns import (
     WEEKDAY_PATTERN,
     PERIOD_UNIT_PATTERN,
@@ -21,18 +25,44 @@ from ..patterns import (
     DURATION_PATTERN,
     TIME_RANGE_PATTERN,
     DUTCH_HOUR_PATTERN,
-    DUTCH_HALF_PATTERN,
-    DUTCH_KWART_OVER_PATTERN,
-    DUTCH_KWART_VOOR_PATTERN,
+    DUTCH_CLOCK_PATTERN,
 )
 
 logger = logging.getLogger(__name__)
 
+_ONE_WORDS = frozenset({"een", "één", "a", "an"})
+
+
+@functools.lru_cache(maxsize=4096)
+def cached_datetime(
+    year: int, month: int, day: int, tz: str | None
+) -> pendulum.DateTime:
+    """Midnight on the given date in tz, memoized.
+
+    pendulum.datetime resolves the timezone on every call, and the parsers build the
+    same anchor dates (quarter starts, holidays, month starts) over and over.
+    DateTime instances are immutable, so sharing them is safe.
+    """
+    return pendulum.datetime(year, month, day, tz=tz)
+
+
+def midnight_after(base: pendulum.DateTime, days: int) -> pendulum.DateTime:
+    """Start of the day `days` days after base's date, in base's timezone.
+
+    Stepping the plain date and binding the timezone once is about three times
+    cheaper than base.add(days=...).start_of("day"), which rebinds it twice.
+    """
+    day = base.date() + timedelta(days=days)
+    return cached_datetime(day.year, day.month, day.day, base.timezone_name)
+
 
 def parse_number_word(text: str) -> int:
     """Parse number words like 'een', 'één', 'a', 'an' to integer."""
     t = text.lower().strip()
-    if t in ("een", "één", "a", "an"):
+    # Digits are the common case; words never reach int(), so no exception is raised
+    if t.isdecimal():
+        return int(t)
+    if t in _ONE_WORDS:
         return 1
     try:
         return int(t)
@@ -42,81 +72,59 @@ def parse_number_word(text: str) -> int:
 
 def normalize_duration_unit(unit: str) -> str | None:
     """Normalize duration unit to pendulum kwarg name."""
-    u = unit.lower().rstrip("s").rstrip("en")
-
-    unit_map = {
-        "dag": "days",
-        "day": "days",
-        "d": "days",
-        "week": "weeks",
-        "wek": "weeks",
-        "w": "weeks",
-        "maand": "months",
-        "month": "months",
-        "jaar": "years",
-        "year": "years",
-        "uur": "hours",
-        "hour": "hours",
-        "h": "hours",
-        "min": "minutes",
-        "minuut": "minutes",
-        "minute": "minutes",
-    }
-
-    return unit_map.get(u)
+    # DURATION_UNITS lists every surface form (incl. plurals) directly
+    return DURATION_UNITS.get(unit.lower().strip())
 
 
 def is_weekday_reference(text: str) -> bool:
     """Check if text contains a weekday reference."""
-    return bool(WEEKDAY_PATTERN.search(text.lower()))
+    # WEEKDAY_PATTERN is case-insensitive; no lowercased copy needed
+    return WEEKDAY_PATTERN.search(text) is not None
 
 
 def extract_period_unit(text: str) -> str | None:
     """Extract and normalize period unit from text, using word boundaries."""
     match = PERIOD_UNIT_PATTERN.search(text.lower())
     if match:
-        return PERIOD_UNITS.get(match.group(1).lower())
+        return PERIOD_UNITS.get(match.group(1))
     return None
 
 
+# Day deltas indexed [base weekday][target weekday]; the same weekday is 7 days
+# away in both directions, never 0
+_DAYS_AHEAD = tuple(tuple((t - b) % 7 or 7 for t in range(7)) for b in range(7))
+_DAYS_BEHIND = tuple(tuple((b - t) % 7 or 7 for t in range(7)) for b in range(7))
+
+
 def get_next_weekday(
     base: pendulum.DateTime,
     target_weekday: int,
     next_week: bool = False,
 ) -> pendulum.DateTime:
     """Get the next occurrence of a weekday from the base date."""
-    current_weekday = base.weekday()
-
-    if next_week:
-        days_ahead = (target_weekday - current_weekday) % 7
-        if days_ahead == 0:
-            days_ahead = 7
-        else:
-            days_ahead += 7
-    else:
-        days_ahead = (target_weekday - current_weekday) % 7
-        if days_ahead == 0:
-            days_ahead = 7
-
-    result = base.add(days=days_ahead).start_of("day")
-    logger.debug(
-        f"get_next_weekday: base={base.to_date_string()}, target={target_weekday}, "
-        f"next_week={next_week} -> {result.to_date_string()}"
-    )
+    days_ahead = _DAYS_AHEAD[base.weekday()][target_weekday]
+    # next_week: the same weekday stays 7 days out, any other moves a week further
+    if next_week and days_ahead < 7:
+        days_ahead += 7
+
+    result = midnight_after(base, days_ahead)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"get_next_weekday: base={base.to_date_string()}, target={target_weekday}, "
+            f"next_week={next_week} -> {result.to_date_string()}"
+        )
     return result
 
 
 def get_prev_weekday(base: pendulum.DateTime, target_weekday: int) -> pendulum.DateTime:
     """Get the previous occurrence of a weekday from the base date."""
-    current_weekday = base.weekday()
-    days_behind = (current_weekday - target_weekday) % 7
-    if days_behind == 0:
-        days_behind = 7
-
-    result = base.subtract(days=days_behind).start_of("day")
-    logger.debug(
-        f"get_prev_weekday: base={base.to_date_string()}, target={target_weekday} -> {result.to_date_string()}"
-    )
+    days_behind = _DAYS_BEHIND[base.weekday()][target_weekday]
+
+    result = midnight_after(base, -days_behind)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"get_prev_weekday: base={base.to_date_string()}, target={target_weekday} -> {result.to_date_string()}"
+        )
     return result
 
 
@@ -139,21 +147,19 @@ def get_nth_weekday_of_month(
     Returns:
         DateTime or None if not found
     """
+    first = cached_datetime(year, month, 1, tz)
     if n == -1:
-        # Last occurrence: start from end of month
-        dt = pendulum.datetime(year, month, 1, tz=tz).end_of("month").start_of("day")
-        while dt.weekday() != weekday:
-            dt = dt.subtract(days=1)
-        return dt
-    else:
-        # Nth occurrence: find first, then add weeks
-        dt = pendulum.datetime(year, month, 1, tz=tz)
-        while dt.weekday() != weekday:
-            dt = dt.add(days=1)
-        dt = dt.add(weeks=n - 1)
-        if dt.month != month:
-            return None
-        return dt
+        # Last occurrence: step back from the last day of the month
+        last_day = first.days_in_month
+        last_weekday = (first.weekday() + last_day - 1) % 7
+        day = last_day - (last_weekday - weekday) % 7
+        return cached_datetime(year, month, day, tz)
+
+    # Nth occurrence: first matching day, then n - 1 weeks on
+    day = 1 + (weekday - first.weekday()) % 7 + 7 * (n - 1)
+    if not 1 <= day <= first.days_in_month:
+        return None
+    return cached_datetime(year, month, day, tz)
 
 
 def has_time(text: str) -> bool:
@@ -173,13 +179,15 @@ def find_range(text: str) -> tuple[str, str] | None:
         m = pat.search(t)
         if m:
             result = (m.group("a").strip(), m.group("b").strip())
-            logger.debug(f"find_range: '{t}' -> {result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"find_range: '{t}' -> {result}")
             return result
 
     m = DASH_RANGE_PATTERN.match(t)
     if m:
         result = (m.group("a").strip(), m.group("b").strip())
-        logger.debug(f"find_range (dash): '{t}' -> {result}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"find_range (dash): '{t}' -> {result}")
         return result
 
     return None
@@ -202,12 +210,14 @@ def parse_duration(text: str) -> pendulum.Duration | None:
         if n <= 24 and not any(
             before_text.endswith(ind) for ind in duration_indicators
         ):
+            lowered = text.lower()
             if has_date(text) or any(
-                w in text.lower() for w in ("morgen", "vandaag", "overmorgen")
+                w in lowered for w in ("morgen", "vandaag", "overmorgen")
             ):
-                logger.debug(
-                    f"parse_duration: '{text}' -> None (interpreted as time, not duration)"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"parse_duration: '{text}' -> None (interpreted as time, not duration)"
+                    )
                 return None
 
     result: pendulum.Duration | None = None
@@ -225,7 +235,7 @@ def parse_duration(text: str) -> pendulum.Duration | None:
     elif u in ("jaar", "jaren", "year", "years"):
         result = pendulum.duration(years=n)
 
-    if result:
+    if result and logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"parse_duration: '{text}' -> {result}")
 
     return result
@@ -233,29 +243,30 @@ def parse_duration(text: str) -> pendulum.Duration | None:
 
 def normalize_dutch_time(text: str) -> str:
     """Normalize Dutch time expressions to standard format."""
-    original_text = text
-
-    def replace_half(match: re.Match) -> str:
-        hour = int(match.group(1))
-        actual_hour = hour - 1 if hour > 0 else 23
-        return f"{actual_hour}:30"
+    # Each rewrite below needs a literal keyword; the rewrites only insert digits
+    # and colons, so checking the original text is enough.
+    lowered = text.lower()
+    has_clock = "half" in lowered or "kwart" in lowered
+    has_range = "van" in lowered or "from" in lowered
+    has_uur = "uur" in lowered
+    if not (has_clock or has_range or has_uur):
+        return text
 
-    text = DUTCH_HALF_PATTERN.sub(replace_half, text)
-
-    def replace_kwart_over(match: re.Match) -> str:
-        hour = int(match.group(1))
-        return f"{hour}:15"
-
-    text = DUTCH_KWART_OVER_PATTERN.sub(replace_kwart_over, text)
+    original_text = text
 
-    def replace_kwart_voor(match: re.Match) -> str:
-        hour = int(match.group(1))
+    def replace_clock(match: re.Match) -> str:
+        hour = int(match.group("hour"))
+        kwart = (match.group("kwart") or "").lower()
+        if kwart == "over":
+            return f"{hour}:15"
+        # 'half 3' and 'kwart voor 3' both count from the hour before
         actual_hour = hour - 1 if hour > 0 else 23
-        return f"{actual_hour}:45"
+        return f"{actual_hour}:45" if kwart else f"{actual_hour}:30"
 
-    text = DUTCH_KWART_VOOR_PATTERN.sub(replace_kwart_voor, text)
+    if has_clock:
+        text = DUTCH_CLOCK_PATTERN.sub(replace_clock, text)
 
-    m = TIME_RANGE_PATTERN.search(text)
+    m = TIME_RANGE_PATTERN.search(text) if has_range else None
     if m:
         prefix = m.group(1)
         start_time = m.group(2)
@@ -269,7 +280,7 @@ def normalize_dutch_time(text: str) -> str:
 
         new_range = f"{prefix} {start_time} {connector} {end_time}"
         text = text[: m.start()] + new_range + text[m.end() :]
-    else:
+    elif has_uur:
 
         def replace_hour(match: re.Match) -> str:
             hour = match.group(1)
@@ -277,7 +288,7 @@ def normalize_dutch_time(text: str) -> str:
 
         text = DUTCH_HOUR_PATTERN.sub(replace_hour, text)
 
-    if text != original_text:
+    if text != original_text and logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"normalize_dutch_time: '{original_text}' -> '{text}'")
 
     return text
@@ -288,11 +299,30 @@ def extract_date_part(text: str) -> str:
     m = DATE_EXTRACT_PATTERN.search(text)
     if m:
         result = m.group(0)
-        logger.debug(f"extract_date_part: '{text}' -> '{result}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"extract_date_part: '{text}' -> '{result}'")
         return result
     return text
 
 
+def _start_of_quarter(dt: pendulum.DateTime) -> pendulum.DateTime:
+    return dt.start_of("month").set(month=(dt.month - 1) // 3 * 3 + 1)
+
+
+def _end_of_quarter(dt: pendulum.DateTime) -> pendulum.DateTime:
+    return _start_of_quarter(dt).add(months=2).end_of("month")
+
+
+_PeriodBound = Callable[[pendulum.DateTime], pendulum.DateTime]
+
+# PERIOD_UNITS value -> (start, end); pendulum's start_of/end_of know no "quarter"
+_PERIOD_BOUNDS: dict[str, tuple[_PeriodBound, _PeriodBound]] = {
+    unit: (methodcaller("start_of", unit), methodcaller("end_of", unit))
+    for unit in ("week", "month", "year")
+}
+_PERIOD_BOUNDS["quarter"] = (_start_of_quarter, _end_of_quarter)
+
+
 def period_bounds(
     text: str, anchor: pendulum.DateTime
 ) -> tuple[pendulum.DateTime, pendulum.DateTime] | None:
@@ -307,8 +337,10 @@ def period_bounds(
     if not unit:
         return None
 
-    result = (anchor.start_of(unit), anchor.end_of(unit))
-    logger.debug(
-        f"period_bounds: '{text}' -> {result[0].to_date_string()} to {result[1].to_date_string()}"
-    )
+    start_of, end_of = _PERIOD_BOUNDS[unit]
+    result = (start_of(anchor), end_of(anchor))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"period_bounds: '{text}' -> {result[0].to_date_string()} to {result[1].to_date_string()}"
+        )
     return result
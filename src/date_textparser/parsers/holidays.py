@@ -5,20 +5,19 @@ Parsers for holiday expressions (fixed and moving holidays).
 from __future__ import annotations
 
 import logging
+from datetime import date, timedelta
 
 import pendulum
 
 from ..vocabulary import FIXED_HOLIDAYS, MOVING_HOLIDAYS
-from ..patterns import MOVING_HOLIDAY_PATTERN
+from ..patterns import FIXED_HOLIDAY_SUBSTRING_PATTERN, MOVING_HOLIDAY_PATTERN
+from .base import cached_datetime
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_easter(year: int) -> tuple[int, int]:
-    """Calculate Easter Sunday using the Anonymous Gregorian algorithm.
-
-    Returns (month, day) tuple.
-    """
+def _compute_easter(year: int) -> tuple[int, int]:
+    """Anonymous Gregorian algorithm for Easter Sunday; returns (month, day)."""
     a = year % 19
     b = year // 100
     c = year % 100
@@ -36,10 +35,28 @@ def calculate_easter(year: int) -> tuple[int, int]:
     return (month, day)
 
 
+# Easter for 1900-2199, computed once at import; other years fall back to the algorithm
+_EASTER_FIRST_YEAR = 1900
+_EASTER_TABLE: tuple[tuple[int, int], ...] = tuple(
+    _compute_easter(y) for y in range(_EASTER_FIRST_YEAR, 2200)
+)
+
+
+def calculate_easter(year: int) -> tuple[int, int]:
+    """Calculate Easter Sunday (Gregorian calendar).
+
+    Returns (month, day) tuple.
+    """
+    index = year - _EASTER_FIRST_YEAR
+    if 0 <= index < len(_EASTER_TABLE):
+        return _EASTER_TABLE[index]
+    return _compute_easter(year)
+
+
 def get_easter(year: int, tz: str) -> pendulum.DateTime:
     """Get Easter Sunday for a given year."""
     month, day = calculate_easter(year)
-    return pendulum.datetime(year, month, day, tz=tz)
+    return cached_datetime(year, month, day, tz)
 
 
 def get_moving_holiday(name: str, year: int, tz: str) -> pendulum.DateTime | None:
@@ -55,14 +72,14 @@ def get_moving_holiday(name: str, year: int, tz: str) -> pendulum.DateTime | Non
     - Carnaval (Carnival Sunday) = Easter - 49
     - Aswoensdag (Ash Wednesday) = Easter - 46
     """
-    name_lower = name.lower().strip()
-
-    if name_lower in MOVING_HOLIDAYS:
-        easter = get_easter(year, tz)
-        offset = MOVING_HOLIDAYS[name_lower]
-        return easter.add(days=offset)
+    offset = MOVING_HOLIDAYS.get(name.lower().strip())
+    if offset is None:
+        return None
 
-    return None
+    # Plain date arithmetic, then one (cached) timezone-aware construction
+    month, day = calculate_easter(year)
+    holiday = date(year, month, day) + timedelta(days=offset)
+    return cached_datetime(holiday.year, holiday.month, holiday.day, tz)
 
 
 def parse_holiday(
@@ -71,22 +88,22 @@ def parse_holiday(
     """Parse fixed holiday expressions like 'kerst', 'koningsdag', 'nieuwjaar'."""
     t = text.lower().strip()
 
-    for holiday, (month, day) in FIXED_HOLIDAYS.items():
-        if holiday in t:
-            year = now.year
-            holiday_date = pendulum.datetime(year, month, day, tz=now.timezone_name)
-            if holiday_date < now.start_of("day"):
-                year += 1
+    # One scan for the leftmost (and at that position longest) holiday name
+    m = FIXED_HOLIDAY_SUBSTRING_PATTERN.search(t)
+    if not m:
+        return None
 
-            start = pendulum.datetime(year, month, day, tz=now.timezone_name)
-            end = start.end_of("day")
+    holiday = m.group(0)
+    month, day = FIXED_HOLIDAYS[holiday]
+    # Already passed this year? Compare calendar fields, no datetime needed.
+    year = now.year + 1 if (month, day) < (now.month, now.day) else now.year
 
-            logger.debug(
-                f"parse_holiday: '{text}' -> {holiday}: {start.to_date_string()}"
-            )
-            return (start, end)
+    start = cached_datetime(year, month, day, now.timezone_name)
+    end = start.end_of("day")
 
-    return None
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"parse_holiday: '{text}' -> {holiday}: {start.to_date_string()}")
+    return (start, end)
 
 
 def parse_moving_holiday(
@@ -97,27 +114,26 @@ def parse_moving_holiday(
     if not m:
         return None
 
-    holiday_name = m.group("holiday").lower()
+    holiday_name = m.group("holiday")
     year_str = m.group("year")
 
+    tz = now.timezone_name or "UTC"
     if year_str:
-        year = int(year_str)
+        result = get_moving_holiday(holiday_name, int(year_str), tz)
     else:
-        year = now.year
-        holiday_date = get_moving_holiday(
-            holiday_name, year, now.timezone_name or "UTC"
-        )
-        if holiday_date and holiday_date < now.start_of("day"):
-            year += 1
+        result = get_moving_holiday(holiday_name, now.year, tz)
+        if result is not None and result.date() < now.date():
+            result = get_moving_holiday(holiday_name, now.year + 1, tz)
 
-    result = get_moving_holiday(holiday_name, year, now.timezone_name or "UTC")
     if result is None:
         return None
 
-    start = result.start_of("day")
+    # get_moving_holiday already returns the start of the day
+    start = result
     end = result.end_of("day")
 
-    logger.debug(
-        f"parse_moving_holiday: '{text}' -> {holiday_name}: {start.to_date_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_moving_holiday: '{text}' -> {holiday_name}: {start.to_date_string()}"
+        )
     return (start, end)
@@ -4,12 +4,15 @@ Parsers for period expressions (quarters, weeks, half-years, seasons, etc.)
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import cast
+import re
+from calendar import monthrange
+from datetime import date
 
 import pendulum
 
-from ..vocabulary import SEASONS, MONTH_NAMES, HALF_YEARS
+from ..vocabulary import SEASONS, MONTH_NAMES, HALF_YEARS, ORDINALS
 from ..patterns import (
     QUARTER_PATTERN,
     WEEK_NUMBER_PATTERN,
@@ -17,10 +20,10 @@ from ..patterns import (
     SEASON_EXPR_PATTERN,
     MONTH_EXPR_PATTERN,
     WEEKEND_PATTERN,
-    PAST_PERIOD_PATTERN,
-    FUTURE_PERIOD_PATTERN,
+    PERIOD_DIRECTION_PATTERN,
     YEAR_BOUNDARY_PATTERN,
 )
+from .base import cached_datetime, midnight_after
 
 logger = logging.getLogger(__name__)
 
@@ -44,30 +47,8 @@ def parse_quarter(
     elif quarter_num:
         quarter = int(quarter_num)
     elif ordinal_group:
-        ordinal = ordinal_group.lower()
-        ordinal_map = {
-            "1e": 1,
-            "eerste": 1,
-            "1ste": 1,
-            "2e": 2,
-            "tweede": 2,
-            "2de": 2,
-            "3e": 3,
-            "derde": 3,
-            "3de": 3,
-            "4e": 4,
-            "vierde": 4,
-            "4de": 4,
-            "1st": 1,
-            "first": 1,
-            "2nd": 2,
-            "second": 2,
-            "3rd": 3,
-            "third": 3,
-            "4th": 4,
-            "fourth": 4,
-        }
-        quarter = ordinal_map.get(ordinal)
+        # QUARTER_PATTERN only captures the ordinals 1-4
+        quarter = ORDINALS.get(ordinal_group)
 
     if quarter is None:
         return None
@@ -86,12 +67,13 @@ def parse_quarter(
         start_month -= 12
         year += 1
 
-    start = pendulum.datetime(year, start_month, 1, tz=now.timezone_name)
+    start = cached_datetime(year, start_month, 1, now.timezone_name)
     end = start.add(months=3).subtract(microseconds=1)
 
-    logger.debug(
-        f"parse_quarter: '{text}' -> Q{quarter} {year}: {start.to_date_string()} to {end.to_date_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_quarter: '{text}' -> Q{quarter} {year}: {start.to_date_string()} to {end.to_date_string()}"
+        )
     return (start, end)
 
 
@@ -114,19 +96,18 @@ def parse_week_number(
         return None
 
     try:
-        start = cast(
-            pendulum.DateTime,
-            pendulum.parse(f"{year}-W{week:02d}-1", tz=now.timezone_name),
-        )
-        end = start.end_of("week")
+        # Raises for week 53 in years that only have 52 ISO weeks
+        monday = date.fromisocalendar(year, week, 1)
+    except ValueError:
+        return None
+    start = cached_datetime(monday.year, monday.month, monday.day, now.timezone_name)
+    end = start.end_of("week")
 
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             f"parse_week_number: '{text}' -> week {week} {year}: {start.to_date_string()} to {end.to_date_string()}"
         )
-        return (start, end)
-    except Exception as e:
-        logger.warning(f"parse_week_number: failed to parse week {week} {year}: {e}")
-        return None
+    return (start, end)
 
 
 def parse_half_year(
@@ -145,7 +126,7 @@ def parse_half_year(
     if h_notation:
         half = int(h_notation[1])
     elif text_group:
-        text_match = text_group.lower()
+        text_match = text_group
         for pattern, h in HALF_YEARS.items():
             if pattern in text_match:
                 half = h
@@ -167,12 +148,13 @@ def parse_half_year(
         start_month -= 12
         year += 1
 
-    start = pendulum.datetime(year, start_month, 1, tz=now.timezone_name)
+    start = cached_datetime(year, start_month, 1, now.timezone_name)
     end = start.add(months=6).subtract(microseconds=1)
 
-    logger.debug(
-        f"parse_half_year: '{text}' -> H{half} {year}: {start.to_date_string()} to {end.to_date_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_half_year: '{text}' -> H{half} {year}: {start.to_date_string()} to {end.to_date_string()}"
+        )
     return (start, end)
 
 
@@ -187,7 +169,7 @@ def parse_season(
     season_group = m.group("season")
     if not season_group:
         return None
-    season_name = season_group.lower()
+    season_name = season_group
     modifier = m.group("modifier")
     year_group = m.group("year")
     explicit_year = int(year_group) if year_group else None
@@ -200,7 +182,7 @@ def parse_season(
     if explicit_year:
         year = explicit_year
     elif modifier:
-        mod = modifier.lower()
+        mod = modifier
         if mod in ("volgende", "volgend", "next"):
             year = now.year + 1
         elif mod in ("vorige", "vorig", "last", "previous", "afgelopen"):
@@ -210,32 +192,18 @@ def parse_season(
     else:
         year = now.year
 
-    if start_month > end_month:  # winter case: Dec-Feb
-        if modifier and modifier.lower() in (
-            "vorige",
-            "vorig",
-            "last",
-            "previous",
-            "afgelopen",
-        ):
-            start = pendulum.datetime(year, start_month, 1, tz=now.timezone_name)
-            end = pendulum.datetime(
-                year + 1, end_month, 1, tz=now.timezone_name
-            ).end_of("month")
-        else:
-            start = pendulum.datetime(year, start_month, 1, tz=now.timezone_name)
-            end = pendulum.datetime(
-                year + 1, end_month, 1, tz=now.timezone_name
-            ).end_of("month")
-    else:
-        start = pendulum.datetime(year, start_month, 1, tz=now.timezone_name)
-        end = pendulum.datetime(year, end_month, 1, tz=now.timezone_name).end_of(
-            "month"
-        )
+    tz = now.timezone_name
+    start = cached_datetime(year, start_month, 1, tz)
+    # Winter (Dec-Feb) ends in the next year
+    end_year = year + 1 if start_month > end_month else year
+    end = cached_datetime(
+        end_year, end_month, monthrange(end_year, end_month)[1], tz
+    ).end_of("day")
 
-    logger.debug(
-        f"parse_season: '{text}' -> {season_name} {year}: {start.to_date_string()} to {end.to_date_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_season: '{text}' -> {season_name} {year}: {start.to_date_string()} to {end.to_date_string()}"
+        )
     return (start, end)
 
 
@@ -250,7 +218,7 @@ def parse_month_expr(
     month_group = m.group("month")
     if not month_group:
         return None
-    month_name = month_group.lower()
+    month_name = month_group
     position = m.group("position")
     year_group = m.group("year")
     explicit_year = int(year_group) if year_group else None
@@ -264,11 +232,11 @@ def parse_month_expr(
     if not explicit_year and month < now.month:
         year = now.year + 1
 
-    month_start = pendulum.datetime(year, month, 1, tz=now.timezone_name)
+    month_start = cached_datetime(year, month, 1, now.timezone_name)
     month_end = month_start.end_of("month")
 
     if position:
-        pos = position.lower()
+        pos = position
         if pos in ("begin", "start"):
             start = month_start
             end = month_start.add(days=9).end_of("day")
@@ -285,9 +253,10 @@ def parse_month_expr(
         start = month_start
         end = month_end
 
-    logger.debug(
-        f"parse_month_expr: '{text}' -> {start.to_date_string()} to {end.to_date_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_month_expr: '{text}' -> {start.to_date_string()} to {end.to_date_string()}"
+        )
     return (start, end)
 
 
@@ -301,93 +270,94 @@ def parse_weekend(
 
     modifier = m.group("modifier")
 
-    # Calculate Saturday of the current week (Mon=0 ... Sun=6)
-    # If today is Sunday (6), Saturday (5) was yesterday (-1)
-    this_saturday = now.add(days=5 - now.weekday()).start_of("day")
+    # Saturday of the current week (Mon=0 ... Sun=6); on Sunday that was yesterday
+    days_to_saturday = 5 - now.weekday()
 
     if modifier:
-        mod = modifier.lower()
+        mod = modifier
         if mod in ("volgend", "volgende", "next"):
-            saturday = this_saturday.add(weeks=1)
+            days_to_saturday += 7
         elif mod in ("vorig", "vorige", "last", "afgelopen"):
-            saturday = this_saturday.subtract(weeks=1)
-        else:
-            saturday = this_saturday
-    else:
-        if now.weekday() > 5:
-            saturday = this_saturday.add(weeks=1)
-        else:
-            saturday = this_saturday
+            days_to_saturday -= 7
+    elif now.weekday() > 5:
+        days_to_saturday += 7
 
-    start = saturday
-    end = saturday.add(days=1).end_of("day")
+    start = midnight_after(now, days_to_saturday)
+    end = midnight_after(now, days_to_saturday + 1).end_of("day")
 
-    logger.debug(
-        f"parse_weekend: '{text}' -> {start.to_date_string()} to {end.to_date_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_weekend: '{text}' -> {start.to_date_string()} to {end.to_date_string()}"
+        )
     return (start, end)
 
 
-def parse_past_period(
-    text: str, now: pendulum.DateTime
+@functools.lru_cache(maxsize=32)
+def match_period_directions(
+    text: str,
+) -> tuple[re.Match[str] | None, re.Match[str] | None]:
+    """
+    First past ('vorige maand') and first future ('volgende week') period match.
+
+    Both are found in one scan; the past, future and relative-quarter parsers run
+    back to back on the same text, so the result is cached on it.
+    """
+    past: re.Match[str] | None = None
+    future: re.Match[str] | None = None
+    for m in PERIOD_DIRECTION_PATTERN.finditer(text):
+        if m.group("past") is not None:
+            past = past or m
+        else:
+            future = future or m
+        if past and future:
+            break
+    return past, future
+
+
+# Singular unit word -> pendulum unit; plurals ('afgelopen maanden') are no period
+_DIRECTIONAL_UNITS: dict[str, str] = {
+    "jaar": "year",
+    "year": "year",
+    "maand": "month",
+    "month": "month",
+    "week": "week",
+}
+
+
+def _shifted_period(
+    m: re.Match[str] | None, now: pendulum.DateTime, offset: int
 ) -> tuple[pendulum.DateTime, pendulum.DateTime] | None:
-    """Parse 'afgelopen jaar', 'vorige maand', 'afgelopen week' etc."""
-    m = PAST_PERIOD_PATTERN.search(text.lower())
     if not m:
         return None
-
-    unit_group = m.group("unit")
-    if not unit_group:
-        return None
-    period = unit_group.lower()
-
-    if period == "jaar":
-        start = now.subtract(years=1).start_of("year")
-        end = start.end_of("year")
-    elif period == "maand":
-        start = now.subtract(months=1).start_of("month")
-        end = start.end_of("month")
-    elif period == "week":
-        start = now.subtract(weeks=1).start_of("week")
-        end = start.end_of("week")
-    else:
+    unit = _DIRECTIONAL_UNITS.get(m.group("unit").lower())
+    if unit is None:
         return None
+    start = now.add(**{f"{unit}s": offset}).start_of(unit)
+    return (start, start.end_of(unit))
 
-    logger.debug(
-        f"parse_past_period: '{text}' -> {start.to_date_string()} to {end.to_date_string()}"
-    )
-    return (start, end)
+
+def parse_past_period(
+    text: str, now: pendulum.DateTime
+) -> tuple[pendulum.DateTime, pendulum.DateTime] | None:
+    """Parse 'afgelopen jaar', 'vorige maand', 'afgelopen week' etc."""
+    result = _shifted_period(match_period_directions(text)[0], now, -1)
+    if result and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_past_period: '{text}' -> {result[0].to_date_string()} to {result[1].to_date_string()}"
+        )
+    return result
 
 
 def parse_future_period(
     text: str, now: pendulum.DateTime
 ) -> tuple[pendulum.DateTime, pendulum.DateTime] | None:
     """Parse 'volgende maand', 'komend jaar', 'next week' etc."""
-    m = FUTURE_PERIOD_PATTERN.search(text.lower())
-    if not m:
-        return None
-
-    unit_group = m.group("unit")
-    if not unit_group:
-        return None
-    period = unit_group.lower()
-
-    if period in ("jaar", "year"):
-        start = now.add(years=1).start_of("year")
-        end = start.end_of("year")
-    elif period in ("maand", "month"):
-        start = now.add(months=1).start_of("month")
-        end = start.end_of("month")
-    elif period == "week":
-        start = now.add(weeks=1).start_of("week")
-        end = start.end_of("week")
-    else:
-        return None
-
-    logger.debug(
-        f"parse_future_period: '{text}' -> {start.to_date_string()} to {end.to_date_string()}"
-    )
-    return (start, end)
+    result = _shifted_period(match_period_directions(text)[1], now, 1)
+    if result and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_future_period: '{text}' -> {result[0].to_date_string()} to {result[1].to_date_string()}"
+        )
+    return result
 
 
 def parse_year_boundary(
@@ -407,11 +377,12 @@ def parse_year_boundary(
     year = int(year_group)
 
     if boundary_type in ("begin", "start"):
-        start = pendulum.datetime(year, 1, 1, tz=now.timezone_name)
+        start = cached_datetime(year, 1, 1, now.timezone_name)
         end = start.end_of("day")
     else:  # eind, end
-        start = pendulum.datetime(year, 12, 31, tz=now.timezone_name)
+        start = cached_datetime(year, 12, 31, now.timezone_name)
         end = start.end_of("day")
 
-    logger.debug(f"parse_year_boundary: '{text}' -> {start.to_date_string()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"parse_year_boundary: '{text}' -> {start.to_date_string()}")
     return (start, end)
@@ -5,16 +5,35 @@ Parsers for relative time expressions (ago, in X days, etc.)
 from __future__ import annotations
 
 import logging
+from calendar import isleap
 
 import pendulum
 
-from ..vocabulary import DUTCH_NUMBER_WORDS, ENGLISH_NUMBER_WORDS, MONTH_NAMES, ORDINALS
+from ..vocabulary import ALL_NUMBER_WORDS, MONTH_NAMES
 from ..patterns import IN_DURATION_PATTERN, AGO_PATTERN, DUTCH_DAY_MONTH_PATTERN
-from .base import parse_number_word, normalize_duration_unit
+from .base import (
+    cached_datetime,
+    midnight_after,
+    parse_number_word,
+    normalize_duration_unit,
+)
 
 logger = logging.getLogger(__name__)
 
-_ALL_NUMBER_WORDS = {**DUTCH_NUMBER_WORDS, **ENGLISH_NUMBER_WORDS, **ORDINALS}
+# Duration units that move whole days; these skip tz-aware DateTime arithmetic
+_DAYS_PER_UNIT: dict[str, int] = {"days": 1, "weeks": 7}
+
+
+def _day_of_offset(
+    now: pendulum.DateTime, unit: str, n: int
+) -> tuple[pendulum.DateTime, pendulum.DateTime]:
+    """Whole day containing now shifted by n units (n may be negative)."""
+    days_per_unit = _DAYS_PER_UNIT.get(unit)
+    if days_per_unit is not None:
+        start = midnight_after(now, n * days_per_unit)
+    else:
+        start = now.add(**{unit: n}).start_of("day")
+    return (start, start.end_of("day"))
 
 
 def parse_in_duration(
@@ -31,13 +50,10 @@ def parse_in_duration(
     if not unit:
         return None
 
-    kwargs = {unit: n}
-    target = now.add(**kwargs)
-
-    start = target.start_of("day")
-    end = target.end_of("day")
+    start, end = _day_of_offset(now, unit, n)
 
-    logger.debug(f"parse_in_duration: '{text}' -> {start.to_date_string()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"parse_in_duration: '{text}' -> {start.to_date_string()}")
     return (start, end)
 
 
@@ -55,13 +71,10 @@ def parse_ago(
     if not unit:
         return None
 
-    kwargs = {unit: n}
-    target = now.subtract(**kwargs)
+    start, end = _day_of_offset(now, unit, -n)
 
-    start = target.start_of("day")
-    end = target.end_of("day")
-
-    logger.debug(f"parse_ago: '{text}' -> {start.to_date_string()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"parse_ago: '{text}' -> {start.to_date_string()}")
     return (start, end)
 
 
@@ -79,18 +92,15 @@ def parse_dutch_day_month(
     if not day_group or not month_group:
         return None
 
-    day_str = day_group.lower()
-    month_str = month_group.lower()
+    day_str = day_group
+    month_str = month_group
     year_str = m.group("year")
 
-    if day_str in _ALL_NUMBER_WORDS:
-        day = _ALL_NUMBER_WORDS[day_str]
-    else:
-        try:
-            # Strip suffixes like 'st', 'nd', 'e', 'ste' (e.g. "1st" -> "1")
-            day = int("".join(filter(str.isdigit, day_str)))
-        except ValueError:
-            return None
+    # 'day_num' holds the digits without a suffix like 'st' or 'e' ("1st" -> "1")
+    day_num = m.group("day_num")
+    day = int(day_num) if day_num else ALL_NUMBER_WORDS.get(day_str)
+    if day is None:
+        return None
 
     if not 1 <= day <= 31:
         return None
@@ -102,25 +112,20 @@ def parse_dutch_day_month(
     if year_str:
         year = int(year_str)
     else:
+        # The next occurrence: this year unless the day has passed, and for
+        # 29 February the first leap year from there
         year = now.year
-        # Try to find the first valid date starting from 'year' (handling leap years and past dates)
-        for offset in range(5):  # Check current year + next 4 years
-            y = year + offset
-            try:
-                test_date = pendulum.datetime(y, month, day, tz=now.timezone_name)
-                # If valid date is in the past (and we didn't specify a year), try next year
-                if offset == 0 and test_date < now.start_of("day"):
-                    continue
-                year = y
-                break
-            except ValueError:
-                # Invalid date (e.g. 29 Feb in non-leap year), try next year
-                continue
+        if (month, day) < (now.month, now.day):
+            year += 1
+        if (month, day) == (2, 29):
+            while not isleap(year):
+                year += 1
 
     try:
-        start = pendulum.datetime(year, month, day, tz=now.timezone_name)
+        start = cached_datetime(year, month, day, now.timezone_name)
         end = start.end_of("day")
-        logger.debug(f"parse_dutch_day_month: '{text}' -> {start.to_date_string()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"parse_dutch_day_month: '{text}' -> {start.to_date_string()}")
         return (start, end)
     except ValueError:
         return None
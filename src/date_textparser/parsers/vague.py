@@ -5,14 +5,117 @@ Parser for vague time expressions (straks, binnenkort, soon, etc.)
 from __future__ import annotations
 
 import logging
+from typing import Any, Callable
 
 import pendulum
 
 from ..vocabulary import VAGUE_TIME_EXPRESSIONS
 from ..patterns import VAGUE_TIME_PATTERN
+from .base import midnight_after
 
 logger = logging.getLogger(__name__)
 
+_Range = tuple[pendulum.DateTime, pendulum.DateTime]
+_VagueRange = Callable[[pendulum.DateTime], _Range]
+
+_DELTA_KEYS = ("hours", "minutes", "days")
+
+
+def _future(config: dict[str, Any]) -> _VagueRange:
+    delta = {k: v for k, v in config.items() if k in _DELTA_KEYS}
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        target = now.add(**delta)
+        return target, target.add(hours=1)
+
+    return vague_range
+
+
+def _past(config: dict[str, Any]) -> _VagueRange:
+    delta = {k: abs(v) for k, v in config.items() if k in _DELTA_KEYS and v < 0}
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        target = now.subtract(**delta)
+        return target, target.add(hours=1)
+
+    return vague_range
+
+
+def _future_range(config: dict[str, Any]) -> _VagueRange:
+    days = config.get("days", 7)
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        return midnight_after(now, 0), midnight_after(now, days).end_of("day")
+
+    return vague_range
+
+
+def _past_range(config: dict[str, Any]) -> _VagueRange:
+    days = abs(config.get("days", -7))
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        return midnight_after(now, -days), midnight_after(now, 0).end_of("day")
+
+    return vague_range
+
+
+def _current_range(config: dict[str, Any]) -> _VagueRange:
+    half = config.get("days", 3) // 2
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        return midnight_after(now, -half), midnight_after(now, half).end_of("day")
+
+    return vague_range
+
+
+def _around_now(config: dict[str, Any]) -> _VagueRange:
+    hours = config.get("hours", 1)
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        return now.subtract(hours=hours), now.add(hours=hours)
+
+    return vague_range
+
+
+def _fixed_today(config: dict[str, Any]) -> _VagueRange:
+    hour = config.get("hour", 12)
+    minute = config.get("minute", 0)
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        target = now.set(hour=hour, minute=minute, second=0, microsecond=0)
+        return target, target.add(hours=2)
+
+    return vague_range
+
+
+def _time_of_day(config: dict[str, Any]) -> _VagueRange:
+    hour = config.get("hour", 12)
+
+    def vague_range(now: pendulum.DateTime) -> _Range:
+        start = now.set(hour=hour, minute=0, second=0, microsecond=0)
+        return start, start.add(hours=2)
+
+    return vague_range
+
+
+_RANGE_BUILDERS: dict[str, Callable[[dict[str, Any]], _VagueRange]] = {
+    "future": _future,
+    "past": _past,
+    "future_range": _future_range,
+    "past_range": _past_range,
+    "current_range": _current_range,
+    "around_now": _around_now,
+    "fixed_today": _fixed_today,
+    "time_of_day": _time_of_day,
+}
+
+# Resolve each expression's config once at import; unknown types stay unparsed
+_VAGUE_DISPATCH: dict[str, _VagueRange] = {
+    expr: _RANGE_BUILDERS[config["type"]](config)
+    for expr, config in VAGUE_TIME_EXPRESSIONS.items()
+    if config.get("type") in _RANGE_BUILDERS
+}
+
 
 def parse_vague_time(
     text: str, now: pendulum.DateTime
@@ -22,67 +125,15 @@ def parse_vague_time(
     if not m:
         return None
 
-    expr = m.group(1).lower()
-    config = VAGUE_TIME_EXPRESSIONS.get(expr)
-
-    if config is None:
+    expr = m.group(1)
+    vague_range = _VAGUE_DISPATCH.get(expr)
+    if vague_range is None:
         return None
 
-    expr_type = config.get("type")
-
-    if expr_type == "future":
-        delta_kwargs = {
-            k: v for k, v in config.items() if k in ("hours", "minutes", "days")
-        }
-        target = now.add(**delta_kwargs)
-        start = target
-        end = target.add(hours=1)
-
-    elif expr_type == "past":
-        delta_kwargs = {}
-        for k, v in config.items():
-            if k in ("hours", "minutes", "days") and v < 0:
-                delta_kwargs[k] = abs(v)
-        target = now.subtract(**delta_kwargs)
-        start = target
-        end = target.add(hours=1)
-
-    elif expr_type == "future_range":
-        days = config.get("days", 7)
-        start = now.start_of("day")
-        end = now.add(days=days).end_of("day")
-
-    elif expr_type == "past_range":
-        days = abs(config.get("days", -7))
-        start = now.subtract(days=days).start_of("day")
-        end = now.end_of("day")
-
-    elif expr_type == "current_range":
-        days = config.get("days", 3)
-        start = now.subtract(days=days // 2).start_of("day")
-        end = now.add(days=days // 2).end_of("day")
-
-    elif expr_type == "around_now":
-        hours = config.get("hours", 1)
-        start = now.subtract(hours=hours)
-        end = now.add(hours=hours)
-
-    elif expr_type == "fixed_today":
-        hour = config.get("hour", 12)
-        minute = config.get("minute", 0)
-        target = now.set(hour=hour, minute=minute, second=0, microsecond=0)
-        start = target
-        end = target.add(hours=2)
-
-    elif expr_type == "time_of_day":
-        hour = config.get("hour", 12)
-        start = now.set(hour=hour, minute=0, second=0, microsecond=0)
-        end = start.add(hours=2)
-
-    else:
-        return None
+    start, end = vague_range(now)
 
-    logger.debug(
-        f"parse_vague_time: '{text}' -> {expr}: {start.to_datetime_string()} to {end.to_datetime_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_vague_time: '{text}' -> {expr}: {start.to_datetime_string()} to {end.to_datetime_string()}"
+        )
     return (start, end)
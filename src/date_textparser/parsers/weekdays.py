@@ -15,10 +15,24 @@ from ..patterns import (
     ORDINAL_WEEKDAY_PATTERN,
     COMPOUND_DAY_PATTERN,
 )
-from .base import get_next_weekday, get_prev_weekday, get_nth_weekday_of_month
+from .base import (
+    get_next_weekday,
+    get_prev_weekday,
+    get_nth_weekday_of_month,
+    midnight_after,
+)
 
 logger = logging.getLogger(__name__)
 
+# Day words of COMPOUND_DAY_PATTERN, as days from today
+_RELATIVE_DAY_OFFSETS: dict[str, int] = {
+    "vandaag": 0,
+    "morgen": 1,
+    "overmorgen": 2,
+    "gisteren": -1,
+    "eergisteren": -2,
+}
+
 
 def try_parse_next_weekday(
     text: str, base: pendulum.DateTime
@@ -28,14 +42,15 @@ def try_parse_next_weekday(
     if not m:
         return None
 
-    weekday_name = m.group(2).lower()
+    weekday_name = m.group(2)
     target_weekday = ALL_WEEKDAYS.get(weekday_name)
 
     if target_weekday is None:
         return None
 
     result = get_next_weekday(base, target_weekday, next_week=True)
-    logger.debug(f"try_parse_next_weekday: '{text}' -> {result.to_date_string()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"try_parse_next_weekday: '{text}' -> {result.to_date_string()}")
     return result
 
 
@@ -47,14 +62,15 @@ def try_parse_prev_weekday(
     if not m:
         return None
 
-    weekday_name = m.group(2).lower()
+    weekday_name = m.group(2)
     target_weekday = ALL_WEEKDAYS.get(weekday_name)
 
     if target_weekday is None:
         return None
 
     result = get_prev_weekday(base, target_weekday)
-    logger.debug(f"try_parse_prev_weekday: '{text}' -> {result.to_date_string()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"try_parse_prev_weekday: '{text}' -> {result.to_date_string()}")
     return result
 
 
@@ -66,8 +82,8 @@ def parse_ordinal_weekday(
     if not m:
         return None
 
-    ordinal_str = m.group("ordinal").lower()
-    weekday_str = m.group("weekday").lower()
+    ordinal_str = m.group("ordinal")
+    weekday_str = m.group("weekday")
     month_str = m.group("month")
     year_str = m.group("year")
 
@@ -87,7 +103,7 @@ def parse_ordinal_weekday(
         year = now.year
 
     if month_str:
-        month_lower = month_str.lower()
+        month_lower = month_str
         if month_lower in ("maand", "month"):
             month = now.month
         else:
@@ -105,11 +121,10 @@ def parse_ordinal_weekday(
         return None
 
     # If result is in the past and no explicit month/year, try next month
-    if month_str is None and year_str is None and result < now.start_of("day"):
-        next_month = now.add(months=1)
+    if month_str is None and year_str is None and result.date() < now.date():
         result = get_nth_weekday_of_month(
-            next_month.year,
-            next_month.month,
+            year + month // 12,
+            month % 12 + 1,
             weekday,
             ordinal,
             now.timezone_name or "UTC",
@@ -117,10 +132,12 @@ def parse_ordinal_weekday(
         if result is None:
             return None
 
-    start = result.start_of("day")
+    # get_nth_weekday_of_month already returns the start of the day
+    start = result
     end = result.end_of("day")
 
-    logger.debug(f"parse_ordinal_weekday: '{text}' -> {start.to_date_string()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"parse_ordinal_weekday: '{text}' -> {start.to_date_string()}")
     return (start, end)
 
 
@@ -132,19 +149,11 @@ def parse_compound_day(
     if not m:
         return None
 
-    day_str = m.group("day").lower()
-    part_str = m.group("part").lower()
-
-    if day_str == "vandaag":
-        target = now
-    elif day_str == "morgen":
-        target = now.add(days=1)
-    elif day_str == "overmorgen":
-        target = now.add(days=2)
-    elif day_str == "gisteren":
-        target = now.subtract(days=1)
-    elif day_str == "eergisteren":
-        target = now.subtract(days=2)
+    day_str = m.group("day")
+    part_str = m.group("part")
+
+    if day_str in _RELATIVE_DAY_OFFSETS:
+        target = midnight_after(now, _RELATIVE_DAY_OFFSETS[day_str])
     elif day_str in ALL_WEEKDAYS:
         weekday = ALL_WEEKDAYS[day_str]
         target = get_next_weekday(now, weekday, next_week=False)
@@ -167,7 +176,8 @@ def parse_compound_day(
     else:
         return None
 
-    logger.debug(
-        f"parse_compound_day: '{text}' -> {start.to_datetime_string()} to {end.to_datetime_string()}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"parse_compound_day: '{text}' -> {start.to_datetime_string()} to {end.to_datetime_string()}"
+        )
     return (start, end)
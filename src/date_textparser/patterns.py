@@ -7,15 +7,15 @@ All patterns are precompiled for performance and organized by category.
 from __future__ import annotations
 
 import re
+from typing import Iterable
 
 from .vocabulary import (
+    ALL_NUMBER_WORDS,
     ALL_WEEKDAYS,
     DUTCH_NUMBER_WORDS,
     DURATION_UNITS,
-    ENGLISH_NUMBER_WORDS,
     MONTH_NAMES,
     MOVING_HOLIDAY_NAMES,
-    ORDINALS,
     PERIOD_UNITS,
     SEASONS,
     FIXED_HOLIDAYS,
@@ -34,9 +34,35 @@ def build_word_pattern(words: set[str] | dict) -> re.Pattern:
         word_set = set(words.keys())
     else:
         word_set = words
-    # Sort by length descending to match longer words first
-    escaped = [re.escape(w) for w in sorted(word_set, key=len, reverse=True)]
-    return re.compile(rf"\b({'|'.join(escaped)})\b", re.IGNORECASE)
+    # The trie alternation prefers the longest word, like a longest-first ordering
+    return re.compile(rf"\b({build_trie_pattern(word_set)})\b", re.IGNORECASE)
+
+
+def build_trie_pattern(words: Iterable[str]) -> str:
+    """Build regex source matching the longest of `words` at a position.
+
+    The alternation is nested as a trie, so at each character the engine follows a
+    single branch instead of trying every word; scanning hundreds of keywords stays
+    one cheap pass.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-word marker
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ending here: the rest is an optional (greedy, so longest) suffix
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
 
 
 # =============================================================================
@@ -45,9 +71,26 @@ def build_word_pattern(words: set[str] | dict) -> re.Pattern:
 
 WEEKDAY_PATTERN = build_word_pattern(ALL_WEEKDAYS)
 PERIOD_UNIT_PATTERN = build_word_pattern(PERIOD_UNITS)
-SEASON_PATTERN = build_word_pattern(SEASONS)
-HOLIDAY_PATTERN = build_word_pattern(FIXED_HOLIDAYS)
-MONTH_PATTERN = build_word_pattern(MONTH_NAMES)
+# Lowercase substring match without word boundaries, so Dutch compounds such as
+# 'kerstdiner' still hit; the trie takes the longest name ('new years eve' over
+# 'new year') and only follows the branch matching the next character
+FIXED_HOLIDAY_SUBSTRING_PATTERN = re.compile(build_trie_pattern(FIXED_HOLIDAYS))
+
+# No parser imports these, so they are compiled on first attribute access
+# instead of at import (PEP 562 module __getattr__)
+_LAZY_WORD_PATTERNS: dict[str, set[str] | dict] = {
+    "SEASON_PATTERN": SEASONS,
+    "HOLIDAY_PATTERN": FIXED_HOLIDAYS,
+    "MONTH_PATTERN": MONTH_NAMES,
+}
+
+
+def __getattr__(name: str) -> re.Pattern:
+    words = _LAZY_WORD_PATTERNS.get(name)
+    if words is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    pattern = globals()[name] = build_word_pattern(words)
+    return pattern
 
 
 # =============================================================================
@@ -123,19 +166,12 @@ HALF_YEAR_PATTERN = re.compile(
 )
 
 # Dynamically build regex for all period units (singular/plural) from vocabulary
-_PERIOD_UNITS_REGEX = "|".join(
-    re.escape(u) for u in sorted(PERIOD_UNITS.keys(), key=len, reverse=True)
-)
+_PERIOD_UNITS_REGEX = build_trie_pattern(PERIOD_UNITS)
 
-PAST_PERIOD_PATTERN = re.compile(
-    r"\b(afgelopen|vorig|vorige|laatste|last|previous)\s+(?P<unit>"
-    + _PERIOD_UNITS_REGEX
-    + r")\b",
-    re.IGNORECASE,
-)
-
-FUTURE_PERIOD_PATTERN = re.compile(
-    r"\b(volgende|volgend|komende|komend|aanstaande|next)\s+(?P<unit>"
+# "afgelopen maand" / "volgende week": the named group that matched gives the direction
+PERIOD_DIRECTION_PATTERN = re.compile(
+    r"\b(?:(?P<past>afgelopen|vorig|vorige|laatste|last|previous)"
+    r"|(?P<future>volgende|volgend|komende|komend|aanstaande|next))\s+(?P<unit>"
     + _PERIOD_UNITS_REGEX
     + r")\b",
     re.IGNORECASE,
@@ -168,11 +204,11 @@ SEASON_EXPR_PATTERN = re.compile(
 # MONTH PATTERN
 # =============================================================================
 
+_MONTH_NAMES_REGEX = build_trie_pattern(MONTH_NAMES)
+
 MONTH_EXPR_PATTERN = re.compile(
     r"\b(?:(?P<position>begin|eind|end|medio|half|midden|mid)\s+)?"
-    r"(?P<month>januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december|"
-    r"jan|feb|mrt|apr|jun|jul|aug|sep|sept|okt|oct|nov|dec|"
-    r"january|february|march|may|june|july|august|october)"
+    r"(?P<month>" + _MONTH_NAMES_REGEX + r")"
     r"(?:\s+(?P<year>\d{4}))?\b",
     re.IGNORECASE,
 )
@@ -182,18 +218,10 @@ MONTH_EXPR_PATTERN = re.compile(
 # DATE PATTERNS
 # =============================================================================
 
-_MONTH_NAMES_REGEX = "|".join(
-    re.escape(m) for m in sorted(MONTH_NAMES.keys(), key=len, reverse=True)
-)
-
-_ALL_NUMBER_WORDS = {**DUTCH_NUMBER_WORDS, **ENGLISH_NUMBER_WORDS, **ORDINALS}
-
 DUTCH_DAY_MONTH_PATTERN = re.compile(
     r"\b(?:op\s+|the\s+|on\s+)??"
-    r"(?P<day>\d{1,2}(?:st|nd|rd|th|e|ste|de)?|"
-    + "|".join(
-        re.escape(w) for w in sorted(_ALL_NUMBER_WORDS.keys(), key=len, reverse=True)
-    )
+    r"(?P<day>(?P<day_num>\d{1,2})(?:st|nd|rd|th|e|ste|de)?|"
+    + build_trie_pattern(ALL_NUMBER_WORDS)
     + r")\s+"
     r"(?:(?:van|of)\s+)?"
     r"(?P<month>" + _MONTH_NAMES_REGEX + r")"
@@ -217,9 +245,7 @@ AGO_PATTERN = re.compile(
 )
 
 # Build pattern dynamically from DURATION_UNITS vocabulary (single source of truth)
-_DURATION_UNITS_REGEX = "|".join(
-    re.escape(u) for u in sorted(DURATION_UNITS.keys(), key=len, reverse=True)
-)
+_DURATION_UNITS_REGEX = build_trie_pattern(DURATION_UNITS)
 
 DURATION_PATTERN = re.compile(
     rf"\b(?P<n>\d+)\s*(?P<u>{_DURATION_UNITS_REGEX})\b",
@@ -232,7 +258,7 @@ DURATION_PATTERN = re.compile(
 # =============================================================================
 
 MOVING_HOLIDAY_PATTERN = re.compile(
-    r"\b(?P<holiday>" + "|".join(re.escape(h) for h in MOVING_HOLIDAY_NAMES) + r")"
+    r"\b(?P<holiday>" + build_trie_pattern(MOVING_HOLIDAY_NAMES) + r")"
     r"(?:\s+(?P<year>\d{4}))?\b",
     re.IGNORECASE,
 )
@@ -242,9 +268,8 @@ MOVING_HOLIDAY_PATTERN = re.compile(
 # VAGUE TIME PATTERNS
 # =============================================================================
 
-_VAGUE_EXPRESSIONS_SORTED = sorted(VAGUE_TIME_EXPRESSIONS.keys(), key=len, reverse=True)
 VAGUE_TIME_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(expr) for expr in _VAGUE_EXPRESSIONS_SORTED) + r")\b",
+    r"\b(" + build_trie_pattern(VAGUE_TIME_EXPRESSIONS) + r")\b",
     re.IGNORECASE,
 )
 
@@ -312,11 +337,7 @@ DATE_EXTRACT_PATTERN = re.compile(
     r"\b\d{1,2}(?:st|nd|rd|th|e|ste|de)?\s+(?:(?:van|of)\s+)?"
     r"(?:" + _MONTH_NAMES_REGEX + r")"
     r"(?:\s+\d{4})?\b|"
-    r"\b(?:"
-    + "|".join(
-        re.escape(w) for w in sorted(DUTCH_NUMBER_WORDS.keys(), key=len, reverse=True)
-    )
-    + r")\s+"
+    r"\b(?:" + build_trie_pattern(DUTCH_NUMBER_WORDS) + r")\s+"
     r"(?:(?:van|of)\s+)?"
     r"(?:" + _MONTH_NAMES_REGEX + r")"
     r"(?:\s+\d{4})?\b|"
@@ -342,6 +363,8 @@ TIME_RANGE_PATTERN = re.compile(
 # =============================================================================
 
 DUTCH_HOUR_PATTERN = re.compile(r"\b(\d{1,2})\s*uur\b", re.IGNORECASE)
-DUTCH_HALF_PATTERN = re.compile(r"\bhalf\s+(\d{1,2})\b", re.IGNORECASE)
-DUTCH_KWART_OVER_PATTERN = re.compile(r"\bkwart\s+over\s+(\d{1,2})\b", re.IGNORECASE)
-DUTCH_KWART_VOOR_PATTERN = re.compile(r"\bkwart\s+voor\s+(\d{1,2})\b", re.IGNORECASE)
+# 'half 3', 'kwart over 3', 'kwart voor 3' in one alternation (one scan of the input)
+DUTCH_CLOCK_PATTERN = re.compile(
+    r"\b(?:(?P<half>half)|kwart\s+(?P<kwart>over|voor))\s+(?P<hour>\d{1,2})\b",
+    re.IGNORECASE,
+)
@@ -25,3 +25,11 @@ class ParseResult:
     end: pendulum.DateTime
     timezone: str
     assumptions: dict[str, Any]
+
+    def __post_init__(self) -> None:
+        # Ranges are reported at second precision; only copy when there is
+        # something to drop.
+        if self.start.microsecond:
+            self.start = self.start.set(microsecond=0)
+        if self.end.microsecond:
+            self.end = self.end.set(microsecond=0)
@@ -449,6 +449,13 @@ ENGLISH_NUMBER_WORDS: dict[str, int] = {
     "thirty-one": 31,
 }
 
+# Every word that can spell out a day of the month ('drie', 'twenty-one', 'derde')
+ALL_NUMBER_WORDS: dict[str, int] = {
+    **DUTCH_NUMBER_WORDS,
+    **ENGLISH_NUMBER_WORDS,
+    **ORDINALS,
+}
+
 # =============================================================================
 # VAGUE TIME EXPRESSIONS
 # =============================================================================
@@ -1 +0,0 @@
-# lib package
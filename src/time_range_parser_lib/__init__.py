@@ -0,0 +1 @@
+# time_range_parser_lib package
@@ -1,7 +1,10 @@
+import functools
 import logging
+import threading
 import time
 import json
 import os
+from datetime import datetime, timedelta
 from typing import Any
 import httpx
 
@@ -20,29 +23,48 @@ CACHE_DIR = os.environ.get("CACHE_DIR", "/cache")
 CACHE_FILE = os.path.join(CACHE_DIR, "time_range_parser_cache.json")
 _CACHE: dict[str, tuple[float, Any]] = {}
 _CACHE_LOADED = False
+# Tool handlers may run concurrently (SSE transport), so guard cache access
+_CACHE_LOCK = threading.RLock()
+
+# In-memory anchors for "now" per timezone: (monotonic time of fetch, API datetime).
+# The current time is derived by adding the elapsed time instead of re-fetching.
+_NOW_ANCHORS: dict[str, tuple[float, datetime]] = {}
 
 # Cache Time-To-Live in seconds
 TTL_IP_TIMEZONE = 3600  # 1 hour
 TTL_TIME_INFO = 300  # 5 minutes
+TTL_CURRENT_TIME = 30  # 30 seconds
 
-# Module-level HTTP client for connection pooling
+# Module-level HTTP client for connection pooling (keep-alive, reused TLS sessions)
 _http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=16)
+
 
+def _get_http_client() -> httpx.Client:
+    """Get or create the shared module-level HTTP client.
 
-def _get_http_client(timeout: float = 5.0) -> httpx.Client:
-    """Get or create module-level HTTP client with specified timeout."""
+    Timeouts are passed per request, so concurrent callers never change
+    settings on the shared client.
+    """
     global _http_client
-    if _http_client is None or _http_client.is_closed:
-        _http_client = httpx.Client(timeout=timeout, http2=False)
-    # Update timeout for this request if different from current
-    if _http_client.timeout.read != timeout:
-        _http_client.timeout = httpx.Timeout(timeout)
-    return _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(timeout=5.0, http2=False, limits=_HTTP_LIMITS)
+        return _http_client
+
+
+_TRUTHY = frozenset({"true", "1", "yes"})
 
 
-def _is_api_enabled() -> bool:
+@functools.lru_cache(maxsize=8)
+def _parse_flag(raw: str) -> bool:
+    return raw.strip().lower() in _TRUTHY
+
+
+def is_api_enabled() -> bool:
     """Check if the WorldTimeAPI integration is enabled via environment variable."""
-    return os.environ.get("USE_WORLDTIME_API", "false").lower() in ("true", "1", "yes")
+    return _parse_flag(os.environ.get("USE_WORLDTIME_API", "false"))
 
 
 def _load_cache() -> None:
@@ -84,35 +106,41 @@ def _save_cache() -> None:
 
 
 def _ensure_cache_loaded() -> None:
-    """Ensure cache is loaded exactly once (called automatically at module init)."""
+    """Ensure cache is loaded exactly once (on first cache access, not at import)."""
     _load_cache()
 
 
 def _get_from_cache(key: str, ttl: float) -> Any | None:
     """Retrieve value from cache if not expired."""
-    if key in _CACHE:
-        timestamp, value = _CACHE[key]
-        if time.time() - timestamp < ttl:
-            logger.debug(f"Cache hit for {key}: {value}")
-            return value
-        else:
-            # Expired, remove from dict and save the change
-            del _CACHE[key]
-            _save_cache()
+    with _CACHE_LOCK:
+        _ensure_cache_loaded()
+        if key in _CACHE:
+            timestamp, value = _CACHE[key]
+            if time.time() - timestamp < ttl:
+                logger.debug(f"Cache hit for {key}: {value}")
+                return value
+            else:
+                # Expired, remove from dict and save the change
+                del _CACHE[key]
+                _save_cache()
     return None
 
 
 def _save_to_cache(key: str, value: Any) -> None:
     """Save value to cache with current timestamp and write to disk."""
-    _CACHE[key] = (time.time(), value)
-    _save_cache()
+    with _CACHE_LOCK:
+        _ensure_cache_loaded()
+        _CACHE[key] = (time.time(), value)
+        _save_cache()
 
 
 def clear_cache() -> None:
     """Clear the internal cache and delete the cache file."""
     global _CACHE, _CACHE_LOADED
-    _CACHE = {}
-    _CACHE_LOADED = True  # We've "loaded" an empty cache
+    with _CACHE_LOCK:
+        _CACHE = {}
+        _CACHE_LOADED = True  # We've "loaded" an empty cache
+        _NOW_ANCHORS.clear()
     if os.path.exists(CACHE_FILE):
         try:
             os.remove(CACHE_FILE)
@@ -126,7 +154,7 @@ def get_ip_info() -> dict[str, Any] | None:
     Fetches detailed time and location info based on public IP via WorldTimeAPI.
     Returns dict with client_ip, timezone, datetime, etc.
     """
-    if not _is_api_enabled():
+    if not is_api_enabled():
         logger.debug("WorldTimeAPI is disabled by USE_WORLDTIME_API flag.")
         return None
 
@@ -137,8 +165,8 @@ def get_ip_info() -> dict[str, Any] | None:
 
     try:
         # Set a short timeout to avoid blocking startup too long
-        client = _get_http_client(timeout=2.0)
-        response = client.get(f"{WORLD_TIME_API_BASE}/ip")
+        client = _get_http_client()
+        response = client.get(f"{WORLD_TIME_API_BASE}/ip", timeout=2.0)
         response.raise_for_status()
         data = response.json()
         if isinstance(data, dict):
@@ -173,8 +201,8 @@ def get_valid_timezones() -> list[str]:
 def _fetch_timezone_data(timezone: str) -> dict[str, Any] | None:
     """Helper to fetch raw timezone data from API with error handling."""
     try:
-        client = _get_http_client(timeout=5.0)
-        response = client.get(f"{WORLD_TIME_API_BASE}/timezone/{timezone}")
+        client = _get_http_client()
+        response = client.get(f"{WORLD_TIME_API_BASE}/timezone/{timezone}", timeout=5.0)
         response.raise_for_status()
         data = response.json()
         if isinstance(data, dict):
@@ -196,14 +224,30 @@ def get_current_time_from_api(timezone: str) -> str | None:
     Fetches the current time for a specific timezone from WorldTimeAPI.
     Returns ISO-8601 string or None if failed.
     """
-    if not _is_api_enabled():
+    if not is_api_enabled():
         logger.debug("WorldTimeAPI is disabled by USE_WORLDTIME_API flag.")
         return None
 
+    with _CACHE_LOCK:
+        anchor = _NOW_ANCHORS.get(timezone)
+    if anchor:
+        fetched_at, api_now = anchor
+        elapsed = time.monotonic() - fetched_at
+        if elapsed < TTL_CURRENT_TIME:
+            logger.debug(f"Derived current time for {timezone} from cached anchor")
+            return (api_now + timedelta(seconds=elapsed)).isoformat()
+
     data = _fetch_timezone_data(timezone)
     if data:
         dt = data.get("datetime")
         if isinstance(dt, str):
+            try:
+                parsed = datetime.fromisoformat(dt)
+            except ValueError:
+                parsed = None
+            if parsed is not None:
+                with _CACHE_LOCK:
+                    _NOW_ANCHORS[timezone] = (time.monotonic(), parsed)
             return dt
     return None
 
@@ -213,7 +257,7 @@ def get_time_info_from_api(timezone: str) -> dict[str, Any] | None:
     Fetches detailed time info for a specific timezone from WorldTimeAPI.
     Returns dict with datetime, dst, utc_offset, etc. or None if failed.
     """
-    if not _is_api_enabled():
+    if not is_api_enabled():
         logger.debug("WorldTimeAPI is disabled by USE_WORLDTIME_API flag.")
         return None
 
@@ -228,7 +272,3 @@ def get_time_info_from_api(timezone: str) -> dict[str, Any] | None:
         _save_to_cache(cache_key, data)
         return data
     return None
-
-
-# Initialize cache on module load
-_ensure_cache_loaded()
@@ -4,12 +4,21 @@ import json
 import logging
 import queue
 import threading
+import time
 import urllib.parse
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 import httpx
 
+_json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -73,7 +82,12 @@ class McpSseClient:
                         line = line.strip("\r")
 
                         if line == "":
-                            data = "\n".join(data_lines).strip()
+                            # iter_lines() already decodes incrementally; only
+                            # multi-line events need an extra join copy
+                            if len(data_lines) == 1:
+                                data = data_lines[0].strip()
+                            else:
+                                data = "\n".join(data_lines).strip()
 
                             if event_type == "endpoint":
                                 # Handle endpoint event: tells us where to POST, incl session_id
@@ -106,7 +120,7 @@ class McpSseClient:
                                     "Attempting to parse SSE data as JSON: %s", data
                                 )
                                 try:
-                                    obj = json.loads(data)
+                                    obj = _json_loads(data)
                                     if (
                                         isinstance(obj, dict)
                                         and "id" in obj
@@ -134,18 +148,24 @@ class McpSseClient:
                             data_lines = []
                             continue
 
-                        if line.startswith(":"):
+                        # One partition() per line; comment lines have an empty field
+                        field, sep, value = line.partition(":")
+                        if not sep or not field:
                             continue
-                        if line.startswith("event:"):
-                            event_type = line.split(":", 1)[1].strip()
-                        elif line.startswith("data:"):
-                            data_lines.append(line.split(":", 1)[1].lstrip())
+                        value = value.removeprefix(" ")
+                        if field == "event":
+                            event_type = value.strip()
+                        elif field == "data":
+                            data_lines.append(value)
 
             except httpx.HTTPStatusError as e:
                 _LOGGER.error("SSE request failed: %s", e)
                 err.append(e)
                 ready.set()
             except Exception as e:
+                if self._stop.is_set():
+                    # Stream torn down by close(); not an error
+                    return
                 _LOGGER.error("SSE reader failed: %s", e, exc_info=True)
                 err.append(e)
                 ready.set()
@@ -241,6 +261,51 @@ class McpSseClient:
             with self._lock:
                 self._responses.pop(id, None)
 
+    def request_batch(
+        self,
+        payloads: list[dict[str, Any]],
+        *,
+        timeout_s: float = 30.0,
+    ) -> list[dict[str, Any]]:
+        """
+        Send several JSON-RPC requests and wait for all responses via SSE.
+
+        The MCP SSE transport accepts a single JSON-RPC message per POST (no
+        batch arrays), so the requests are posted back-to-back without waiting
+        in between and the replies are correlated by id afterwards.
+        Responses are returned in the same order as `payloads`.
+        """
+        queues: dict[int, queue.Queue[dict[str, Any]]] = {
+            p["id"]: queue.Queue() for p in payloads
+        }
+
+        with self._lock:
+            self._responses.update(queues)
+
+        try:
+            _LOGGER.info("Sending batch of %d requests", len(payloads))
+            for payload in payloads:
+                self._post(payload)
+
+            deadline = time.monotonic() + timeout_s
+            results: list[dict[str, Any]] = []
+            for payload in payloads:
+                rpc_id = payload["id"]
+                remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    results.append(queues[rpc_id].get(timeout=remaining))
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No response for id={rpc_id} within {timeout_s}s"
+                    )
+
+            _LOGGER.info("Received %d batch responses", len(results))
+            return results
+        finally:
+            with self._lock:
+                for rpc_id in queues:
+                    self._responses.pop(rpc_id, None)
+
     def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
         """
         Send a JSON-RPC notification (no id). No response expected.
@@ -274,6 +339,6 @@ class McpSseClient:
                 if item.get("type") == "text":
                     text = item.get("text", "")
                     try:
-                        return json.loads(text)
+                        return _json_loads(text)
                     except (json.JSONDecodeError, TypeError):
                         return text
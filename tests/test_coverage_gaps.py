@@ -1,4 +1,9 @@
+import os
+import subprocess
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
+
 import pytest
 
 from date_textparser.core import parse_time_range, expand_recurrence
@@ -121,5 +126,177 @@ class TestRecurrenceAndDuration:
         assert e.year == s.year + 1
 
 
+class TestDutchClockNormalization:
+    """Tests voor normalize_dutch_time (base.py)."""
+
+    def test_all_clock_forms_in_one_pass(self):
+        from date_textparser.parsers import normalize_dutch_time
+
+        assert (
+            normalize_dutch_time("half 3, Kwart over 4 of kwart voor 0")
+            == "2:30, 4:15 of 23:45"
+        )
+
+    def test_text_without_keywords_is_returned_unchanged(self):
+        from date_textparser.parsers import normalize_dutch_time
+
+        text = "volgende week dinsdag 15:00"
+        assert normalize_dutch_time(text) is text
+        # Bereik zonder 'uur'/'half'/'kwart' wordt wel genormaliseerd
+        assert normalize_dutch_time("van 9 tot 10") == "van 9:00 tot 10:00"
+
+
+class TestPeriodBounds:
+    """Tests voor period_bounds (base.py)."""
+
+    def test_quarter_uses_calendar_quarter(self):
+        import pendulum
+        from date_textparser.parsers import period_bounds
+
+        anchor = pendulum.datetime(2026, 11, 11, 10, 30, tz="Europe/Amsterdam")
+        start, end = period_bounds("dit kwartaal", anchor)
+        assert start.isoformat() == "2026-10-01T00:00:00+02:00"
+        assert end.isoformat() == "2026-12-31T23:59:59.999999+01:00"
+        # Overige eenheden blijven pendulum's start_of/end_of volgen
+        start, end = period_bounds("deze maand", anchor)
+        assert (start.day, end.day) == (1, 30)
+
+
+class TestParserTriggers:
+    """Tests voor de keyword-poort voor de specialized parsers (core.py)."""
+
+    def test_uppercase_input_passes_gate(self, now):
+        s, e = parse_time_range("Q3 2026", now=now)
+        assert (s.month, e.month) == (7, 9)
+
+        s, e = parse_time_range("VOLGEND WEEKEND", now=now)
+        assert s.weekday() == 5
+
+    def test_gated_parsers_unaffected_without_triggers(self, now):
+        # Geen enkele trigger: valt door naar de generieke parser
+        s, e = parse_time_range("26-01-2026 14:00", now=now)
+        assert (s.day, s.hour) == (26, 14)
+
+    def test_range_and_weekday_gates(self, now):
+        s, e = parse_time_range("Van 9:00 TOT 17:00", now=now)
+        assert (s.hour, e.hour) == (9, 17)
+
+        s, e = parse_time_range("TUSSEN 10:00 EN 11:00", now=now)
+        assert (s.hour, e.hour) == (10, 11)
+
+        # Vorige vrijdag = 23 jan
+        s, e = parse_time_range("Vorige Vrijdag", now=now)
+        assert s.day == 23
+
+    def test_single_scan_matches_per_word_check(self):
+        # Overlappende triggers ('week'/'weekend', 'kwartaal'/'kwartalen', 'dag' in 'maandag')
+        from date_textparser.core import _PARSER_TRIGGERS, _triggered_kinds
+
+        for text in (
+            "volgend weekend",
+            "komende kwartalen",
+            "maandagochtend",
+            "tweede kerstdag",
+            "eerste helft 2026",
+            "26-01-2026 14:00",
+        ):
+            expected = {
+                kind
+                for kind, triggers in _PARSER_TRIGGERS.items()
+                if any(w in text for w in triggers)
+            }
+            assert _triggered_kinds(text) == expected, text
+
+    def test_word_pattern_prefers_longest_word(self):
+        """Trie-alternatie: langste woord wint, ongeacht de volgorde van de woorden."""
+        from date_textparser.patterns import build_word_pattern
+
+        pattern = build_word_pattern({"easter", "easter monday", "zo", "zo meteen"})
+        assert pattern.search("Easter Monday 2026").group(1) == "Easter Monday"
+        assert pattern.search("easter 2026").group(1) == "easter"
+        assert pattern.search("ik kom zo meteen").group(1) == "zo meteen"
+        assert pattern.search("zomer") is None
+
+    def test_lazy_word_patterns(self):
+        """Ongebruikte woordpatronen worden pas bij eerste toegang gecompileerd."""
+        from date_textparser import patterns
+
+        assert patterns.MONTH_PATTERN.search("in maart").group(1) == "maart"
+        assert patterns.MONTH_PATTERN is patterns.MONTH_PATTERN
+        assert patterns.SEASON_PATTERN.search("deze zomer") is not None
+        missing = "NO_SUCH_PATTERN"
+        with pytest.raises(AttributeError):
+            getattr(patterns, missing)
+
+
+class TestFastPaths:
+    """Tests voor de snelle paden voor kale weekdagen en ISO-datums (core.py)."""
+
+    def test_bare_weekday_is_next_occurrence(self, now):
+        # Maandag 26 jan: "maandag" is volgende week, "dinsdag" morgen
+        s, e = parse_time_range("maandag", now=now)
+        assert (s.day, s.hour) == (2, 0)
+        assert e == end_of_day(s)
+
+        s, e = parse_time_range("Dinsdag", now=now)
+        assert s.day == 27
+
+    def test_iso_date_and_datetime(self, now):
+        s, e = parse_time_range("2026-05-01", now=now)
+        assert (s.month, s.day, s.hour) == (5, 1, 0)
+        assert e == end_of_day(s)
+
+        s, e = parse_time_range("2026-05-01 10:15", now=now)
+        assert (s.hour, s.minute) == (10, 15)
+        assert e - s == timedelta(hours=1)
+
+    def test_iso_datetime_with_offset(self):
+        from date_textparser.core import parse_time_range_full
+
+        r = parse_time_range_full(
+            "2026-05-01T08:00:00-05:00",
+            tz="Europe/Amsterdam",
+            now_iso="2026-01-26T09:00:00",
+        )
+        assert r.start.isoformat() == "2026-05-01T15:00:00+02:00"
+        assert r.assumptions["kind"] == "time_with_default_duration"
+
+    def test_invalid_iso_date_falls_through(self, now):
+        with pytest.raises(ValueError):
+            parse_time_range("2026-13-45", now=now)
+
+    def test_fast_paths_do_not_import_dateparser(self):
+        # Eigen proces: in de testsessie is dateparser al geladen
+        code = (
+            "import sys\n"
+            "from date_textparser.core import parse_time_range_full\n"
+            "for t in ('2026-05-01 10:15', 'vrijdag', 'vorig kwartaal'):\n"
+            "    parse_time_range_full(t, now_iso='2026-01-26T09:00:00')\n"
+            "print('dateparser' in sys.modules)\n"
+        )
+        assert _run_isolated(code) == "False"
+
+    def test_warm_up_loads_dateparser(self):
+        code = (
+            "import sys\n"
+            "from date_textparser.core import warm_up\n"
+            "warm_up()\n"
+            "print('dateparser' in sys.modules)\n"
+        )
+        assert _run_isolated(code) == "True"
+
+
+def _run_isolated(code):
+    """Voer `code` uit in een vers Python-proces met src/ op het pad; geeft stdout."""
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parent.parent / "src")},
+    )
+    return out.stdout.strip()
+
+
 def end_of_day(dt):
     return dt.replace(hour=23, minute=59, second=59, microsecond=0)
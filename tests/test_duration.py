@@ -44,6 +44,19 @@ class TestCalculateDuration:
         assert dur["total_days"] == -1.0
         assert dur["business_days"] == -1
 
+    def test_business_days_multi_year(self, now_iso):
+        """
+        Vrijdag 30 jan 2026 tot vrijdag 2 feb 2029: 1099 dagen = 157 weken.
+        Werkdagen: 157 * 5 = 785.
+        """
+        result = calculate_duration(
+            start_text="30 januari 2026", end_text="2 februari 2029", now_iso=now_iso
+        )
+
+        dur = result["duration"]
+        assert dur["total_days"] == 1099.0
+        assert dur["business_days"] == 785
+
     def test_hours_diff(self, now_iso):
         # Use times strictly in the future relative to now (12:00) to avoid day shifts
         result = calculate_duration("13:00", "16:30", now_iso=now_iso)
@@ -122,6 +122,17 @@ class TestParseTimeRangeFull:
         assert result.start.month == 4  # April
         assert result.end.month == 6  # June
 
+    def test_fiscal_start_month_bound_per_call(self):
+        """Alternating fiscal_start_month must not reuse another month's parsers."""
+        now_iso = "2026-08-10T12:00:00"
+        for _ in range(2):
+            calendar = parse_time_range_full("vorig kwartaal", now_iso=now_iso)
+            fiscal = parse_time_range_full(
+                "vorig kwartaal", now_iso=now_iso, fiscal_start_month=2
+            )
+            assert (calendar.start.month, calendar.end.month) == (4, 6)
+            assert (fiscal.start.month, fiscal.end.month) == (5, 7)
+
 
 class TestEdgeCaseInputs:
     """Test edge case inputs that might cause issues."""
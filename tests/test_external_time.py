@@ -7,7 +7,7 @@ import httpx
 # Ensure src is in path
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
-from lib.external_time import (
+from time_range_parser_lib.external_time import (
     get_local_timezone_from_ip,
     get_valid_timezones,
     get_current_time_from_api,
@@ -23,7 +23,7 @@ def clean_cache_fixture():
     clear_cache()
 
 
-@patch("lib.external_time._get_http_client")
+@patch("time_range_parser_lib.external_time._get_http_client")
 def test_get_local_timezone_from_ip_success(mock_get_client):
     # Enable API explicitly for this test
     with patch.dict(os.environ, {"USE_WORLDTIME_API": "true"}):
@@ -50,7 +50,7 @@ def test_get_valid_timezones_static():
     assert "UTC" in result
 
 
-@patch("lib.external_time._get_http_client")
+@patch("time_range_parser_lib.external_time._get_http_client")
 def test_get_current_time_from_api_success(mock_get_client):
     with patch.dict(os.environ, {"USE_WORLDTIME_API": "true"}):
         mock_client = MagicMock()
@@ -75,8 +75,8 @@ def test_api_disabled_behavior():
         assert get_current_time_from_api("UTC") is None
 
 
-@patch("lib.external_time.logger")
-@patch("lib.external_time._get_http_client")
+@patch("time_range_parser_lib.external_time.logger")
+@patch("time_range_parser_lib.external_time._get_http_client")
 def test_get_current_time_from_api_http_error(mock_get_client, mock_logger):
     """Test that HTTPStatusError is handled gracefully and logged."""
     with patch.dict(os.environ, {"USE_WORLDTIME_API": "true"}):
@@ -100,3 +100,23 @@ def test_get_current_time_from_api_http_error(mock_get_client, mock_logger):
         mock_logger.warning.assert_called_once()
         call_args, _ = mock_logger.warning.call_args
         assert "HTTP error fetching time for Invalid/Zone: 404" in call_args[0]
+
+
+@patch("time_range_parser_lib.external_time._get_http_client")
+def test_get_current_time_from_api_reuses_recent_fetch(mock_get_client):
+    """A second call within the TTL derives 'now' from the first fetch."""
+    with patch.dict(os.environ, {"USE_WORLDTIME_API": "true"}):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get.return_value.json.return_value = {
+            "datetime": "2026-01-01T12:00:00.000000+01:00"
+        }
+        mock_client.get.return_value.raise_for_status = MagicMock()
+
+        first = get_current_time_from_api("Europe/Amsterdam")
+        second = get_current_time_from_api("Europe/Amsterdam")
+
+        assert first == "2026-01-01T12:00:00.000000+01:00"
+        assert second.startswith("2026-01-01T12:00:0")
+        assert second.endswith("+01:00")
+        assert mock_client.get.call_count == 1
@@ -87,6 +87,37 @@ class TestMovingHolidays:
         assert start == datetime(2026, 5, 14, 0, 0, 0)
         assert end == datetime(2026, 5, 14, 23, 59, 59)
 
+    def test_hemelvaart_already_passed_rolls_to_next_year(self):
+        """Na hemelvaart 2026 (14 mei) -> hemelvaart 2027 = 6 mei."""
+        start, end = parse_time_range("hemelvaart", now=datetime(2026, 6, 1, 10, 0, 0))
+        assert start == datetime(2027, 5, 6, 0, 0, 0)
+        assert end == datetime(2027, 5, 6, 23, 59, 59)
+
+    def test_pasen_per_timezone(self, now):
+        """Gecachte ankerdatums zijn per tijdzone: zelfde datum, eigen offset."""
+        from date_textparser.core import parse_time_range_full
+
+        for _ in range(2):
+            ams = parse_time_range_full(
+                "pasen 2026", tz="Europe/Amsterdam", now_iso="2026-01-30T10:00:00"
+            )
+            ny = parse_time_range_full(
+                "pasen 2026", tz="America/New_York", now_iso="2026-01-30T10:00:00"
+            )
+            assert ams.start.isoformat() == "2026-04-05T00:00:00+02:00"
+            assert ny.start.isoformat() == "2026-04-05T00:00:00-04:00"
+
+    def test_calculate_easter_table_and_fallback(self):
+        """Tabel (1900-2199) en algoritme daarbuiten geven dezelfde paasdatums."""
+        from date_textparser.parsers import calculate_easter
+
+        assert calculate_easter(1900) == (4, 15)
+        assert calculate_easter(2026) == (4, 5)
+        assert calculate_easter(2199) == (4, 14)
+        # Buiten de tabel: 22 maart, de vroegst mogelijke datum
+        assert calculate_easter(1818) == (3, 22)
+        assert calculate_easter(2285) == (3, 22)
+
 
 class TestOrdinalWeekdaysExtended:
     """Extended tests voor ordinale weekdagen."""
@@ -129,6 +160,18 @@ class TestOrdinalWeekdaysExtended:
         assert start == datetime(2026, 2, 18, 0, 0, 0)
         assert end == datetime(2026, 2, 18, 23, 59, 59)
 
+    def test_nth_weekday_helper(self):
+        """Rechtstreeks berekend: geen 5e maandag in feb 2026, en altijd middernacht."""
+        from date_textparser.parsers import get_nth_weekday_of_month
+
+        assert get_nth_weekday_of_month(2026, 2, 0, 5, "Europe/Amsterdam") is None
+        assert get_nth_weekday_of_month(2026, 2, 0, 0, "Europe/Amsterdam") is None
+        last = get_nth_weekday_of_month(2026, 2, 4, -1, "Europe/Amsterdam")
+        assert last.isoformat() == "2026-02-27T00:00:00+01:00"
+        # Santiago: zomertijd begint om middernacht op zo 6 sep 2020
+        first_monday = get_nth_weekday_of_month(2020, 9, 0, 1, "America/Santiago")
+        assert first_monday.isoformat() == "2020-09-07T00:00:00-03:00"
+
     def test_first_monday_of_march(self, now):
         start, end = parse_time_range("first monday of march", now=now)
         print_result("first monday of march", now, start, end, "1st monday march (EN)")
@@ -39,4 +39,83 @@ def test_now_iso_timezone_handling():
     assert result.start.year == 2026
     assert result.start.month == 1
     assert result.start.day == 1
-    assert result.start.hour == 12
\ No newline at end of file
+    assert result.start.hour == 12
+
+def test_now_iso_repeated_parse_is_cached_and_isolated():
+    """
+    Herhaalde parses met dezelfde now_iso komen uit de cache, maar elke
+    aanroep krijgt een eigen assumptions dict.
+    """
+    from date_textparser.core import _parse_time_range_cached, clear_parse_cache
+
+    clear_parse_cache()
+    fixed_now = "2026-01-01T12:00:00"
+    first = parse_time_range_full("volgende week", now_iso=fixed_now)
+    first.assumptions["kind"] = "gewijzigd"
+    second = parse_time_range_full("volgende week", now_iso=fixed_now)
+
+    assert second.start == first.start
+    assert second.end == first.end
+    assert second.assumptions["kind"] != "gewijzigd"
+    assert _parse_time_range_cached.cache_info().hits == 1
+
+    # Een andere 'nu' geeft een ander resultaat
+    later = parse_time_range_full("nu", now_iso="2026-01-01T12:00:01")
+    assert later.start.second == 1
+
+
+def test_now_iso_ambiguous_wall_time_not_shared_in_cache():
+    """
+    02:30 op de wintertijd-nacht bestaat twee keer; beide lezingen mogen
+    elkaars cache-entry niet teruggeven.
+    """
+    from date_textparser.core import clear_parse_cache
+
+    clear_parse_cache()
+    summer = parse_time_range_full(
+        "nu", tz="Europe/Amsterdam", now_iso="2026-10-25T02:30:00+02:00"
+    )
+    winter = parse_time_range_full(
+        "nu", tz="Europe/Amsterdam", now_iso="2026-10-25T02:30:00+01:00"
+    )
+    assert summer.start.isoformat() == "2026-10-25T02:30:00+02:00"
+    assert winter.start.isoformat() == "2026-10-25T02:30:00+01:00"
+
+
+@pytest.mark.parametrize(
+    "now_iso",
+    [
+        "2026-01-01T12:00:00",
+        "2026-01-01T12:00:00Z",
+        "2026-01-01T12:00:00+05:30",
+        "2026-01-01",
+        "2026-03-29T02:30:00",  # bestaat niet (zomertijd)
+        "2026-10-25T02:30:00",  # bestaat twee keer (wintertijd)
+        "20260101T120000",
+        "2026-W01-4",
+        "2026-001",  # geen fromisoformat, valt terug op pendulum.parse
+        "2026/01/01",
+    ],
+)
+def test_resolve_now_matches_pendulum_parse(now_iso):
+    """
+    _resolve_now gebruikt datetime.fromisoformat als snelle route, maar moet
+    exact hetzelfde tijdstip en dezelfde offset geven als pendulum.parse.
+    """
+    import pendulum
+
+    from date_textparser.core import _resolve_now
+
+    tz = "Europe/Amsterdam"
+    expected = pendulum.parse(now_iso, tz=tz).in_timezone(tz)
+    resolved = _resolve_now(now_iso, tz)
+    assert resolved.isoformat() == expected.isoformat()
+    assert resolved.timezone_name == tz
+
+
+def test_now_iso_with_microseconds_is_floored():
+    """ParseResult rapporteert altijd op secondeprecisie, ook voor 'nu'."""
+    result = parse_time_range_full("nu", now_iso="2026-01-01T12:00:00.987654")
+    assert result.start.microsecond == 0
+    assert result.end.microsecond == 0
+    assert result.start.second == 0
@@ -313,6 +313,15 @@ class TestPastPeriods:
         result = parse_time_range_full("afgelopen jaar", now_iso=now.isoformat())
         assert result.assumptions["kind"] == "past_period"
 
+    def test_english_past_period_matches_future_vocabulary(self, now):
+        """'last month' is handled like 'next month', without falling back to dateparser."""
+        result = parse_time_range_full("last month", now_iso=now.isoformat())
+        assert result.assumptions["kind"] == "past_period"
+        result = parse_time_range_full(
+            "vorig kwartaal of volgende week", now_iso=now.isoformat()
+        )
+        assert result.assumptions["kind"] == "relative_quarter"
+
 
 class TestFuturePeriods:
     """Tests for future period parsing (volgend kwartaal, etc.)."""
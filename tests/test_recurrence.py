@@ -77,3 +77,31 @@ class TestExpandRecurrence:
     def test_unknown_pattern_raises_error(self):
         with pytest.raises(ValueError, match="Kon geen herhalingspatroon herkennen"):
             expand_recurrence("hallo wereld")
+
+    def test_daily_keeps_wall_clock_across_dst(self):
+        """Dagelijkse reeks over de zomertijdwissel (29 maart) houdt 09:00 aan."""
+        result = expand_recurrence(
+            "dagelijks", tz="Europe/Amsterdam", now_iso="2026-03-28T09:00:00", count=3
+        )
+        assert result["dates"] == [
+            "2026-03-28T09:00:00+01:00",
+            "2026-03-29T09:00:00+02:00",
+            "2026-03-30T09:00:00+02:00",
+        ]
+
+    def test_daily_in_dst_gap_follows_pendulum(self):
+        """02:30 bestaat niet op 29 maart; pendulum schuift door naar 03:30."""
+        result = expand_recurrence(
+            "dagelijks", tz="Europe/Amsterdam", now_iso="2026-03-28T02:30:00", count=3
+        )
+        assert result["dates"] == [
+            "2026-03-28T02:30:00+01:00",
+            "2026-03-29T03:30:00+02:00",
+            "2026-03-30T03:30:00+02:00",
+        ]
+
+    def test_hourly_uses_elapsed_time(self):
+        result = expand_recurrence(
+            "elk uur", tz="UTC", now_iso="2026-03-28T23:00:00Z", count=2
+        )
+        assert result["dates"] == ["2026-03-28T23:00:00Z", "2026-03-29T00:00:00Z"]
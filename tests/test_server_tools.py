@@ -1,12 +1,19 @@
 import os
 import sys
 from unittest.mock import patch
+import pendulum
 import pytest
 
 # Ensure root is in path to import server_main
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from server_main import get_world_time
+from server_main import (
+    get_world_time,
+    _resolve_context,
+    _iso_seconds,
+    normalize_text,
+    server_info,
+)
 
 
 @patch("server_main.get_time_info_from_api")
@@ -52,3 +59,43 @@ def test_get_world_time_disabled():
         result = get_world_time(city="Amsterdam")
         assert "error" in result
         assert "WorldTimeAPI is disabled" in result["error"]
+
+
+@patch("server_main.get_current_time_from_api")
+@patch("server_main.get_local_timezone_from_ip")
+def test_resolve_context_refetches_now_for_other_timezone(mock_ip_tz, mock_now):
+    with patch.dict(os.environ, {"USE_WORLDTIME_API": "true"}):
+        mock_ip_tz.return_value = "Asia/Tokyo"
+        mock_now.side_effect = lambda tz: f"now-in-{tz}"
+
+        tz, now_iso = _resolve_context(None, None)
+        assert tz == "Asia/Tokyo"
+        assert now_iso == "now-in-Asia/Tokyo"
+
+
+@pytest.mark.parametrize(
+    "tz",
+    ["UTC", "Europe/Amsterdam", "Europe/London", "Asia/Kolkata", "America/St_Johns"],
+)
+def test_iso_seconds_matches_pendulum(tz):
+    dt = pendulum.datetime(2026, 3, 29, 2, 30, 15, 123456, tz=tz)
+    assert _iso_seconds(dt) == dt.set(microsecond=0).to_iso8601_string()
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("  'Black Friday 2025' ", "black friday 2025"),
+        ('\u00a0"kerst"\f', "kerst"),  # ook Unicode-witruimte (NBSP, \f)
+        ("'\" kerst \"'", " kerst "),  # witruimte binnen de quotes blijft staan
+    ],
+)
+def test_normalize_text_strips_whitespace_then_quotes(raw, expected):
+    assert normalize_text(raw) == expected
+
+
+def test_server_info_responses_do_not_share_capabilities():
+    with patch.dict(os.environ, {"USE_WORLDTIME_API": "false"}):
+        first = server_info()
+        first["capabilities"]["natural_language_parsing"] = False
+        assert server_info()["capabilities"]["natural_language_parsing"] is True
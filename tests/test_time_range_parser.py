@@ -938,6 +938,15 @@ class TestEnglishExtended:
         target = (now - timedelta(weeks=2)).date()
         assert start.date() == target
 
+    def test_dutch_plural_units(self, now: datetime):
+        """'over 2 jaren' / '3 jaren geleden' -> meervoud 'jaren' wordt herkend."""
+        start, end = parse_time_range("over 2 jaren", now=now)
+        assert start == datetime(2028, 1, 26, 0, 0, 0)
+        assert end == end_of_day(start)
+
+        start, end = parse_time_range("3 jaren geleden", now=now)
+        assert start == datetime(2023, 1, 26, 0, 0, 0)
+
     def test_written_date_english(self, now: datetime):
         """'fifth of january' -> 5 januari."""
         start, end = parse_time_range("fifth of january", now=now)
@@ -990,6 +999,18 @@ class TestEnglishExtended:
         assert start.month == 12
         assert start.day == 25
 
+    def test_longest_holiday_name_wins(self, now: datetime):
+        """'tweede kerstdag' / 'new years eve' niet verwarren met 'kerst' / 'new year'."""
+        start, end = parse_time_range("tweede kerstdag", now=now)
+        assert start == datetime(2026, 12, 26, 0, 0, 0)
+
+        start, end = parse_time_range("new years eve", now=now)
+        assert start == datetime(2026, 12, 31, 0, 0, 0)
+
+        # Samenstelling blijft matchen
+        start, end = parse_time_range("kerstdiner", now=now)
+        assert start == datetime(2026, 12, 25, 0, 0, 0)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tests: Ambiguous cases
@@ -1060,6 +1081,11 @@ class TestSuffixesAndLeapYears:
         assert start == datetime(2028, 2, 29, 0, 0, 0)
         assert end == end_of_day(start)
 
+    def test_leap_day_across_century(self):
+        """'29 februari' vanuit 2097 -> 2104 (2100 is geen schrikkeljaar)."""
+        start, end = parse_time_range("29 februari", now=datetime(2097, 6, 1, 12, 0, 0))
+        assert start == datetime(2104, 2, 29, 0, 0, 0)
+
     def test_year_boundary_smart(self, now_december: datetime):
         """'2 januari' vanuit december -> moet naar volgend jaar."""
         start, end = parse_time_range("2nd of january", now=now_december)
@@ -28,6 +28,19 @@ class TestTimezoneAliases:
         assert normalize_timezone("Europe/Berlin") == "Europe/Berlin"
         assert normalize_timezone("Mars/City") == "Mars/City"
 
+    def test_normalize_canonical_id_that_is_also_alias(self):
+        # Exact IANA ids still go through the alias table (e.g. GMT -> UTC)
+        assert normalize_timezone("GMT") == "UTC"
+        assert normalize_timezone("EST") == "America/New_York"
+        assert normalize_timezone(" Europe/Berlin ") == "Europe/Berlin"
+
+    def test_alias_table_not_mutated(self):
+        # City lookups come from a derived table, the vocabulary stays untouched
+        from date_textparser.vocabulary import TIMEZONE_ALIASES
+
+        assert normalize_timezone("Addis Ababa") == "Africa/Addis_Ababa"
+        assert "addis ababa" not in TIMEZONE_ALIASES
+
     def test_integration_in_parser(self):
         """Ensure parse_time_range_full accepts aliases."""
         # Should not raise InvalidTimezone
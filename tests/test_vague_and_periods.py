@@ -90,6 +90,16 @@ class TestVagueTimes:
         expected_start = now - timedelta(minutes=10)
         assert start == expected_start
 
+    def test_binnenkort_zonder_middernacht(self):
+        """'binnenkort' op een dag zonder 00:00 (Havana) start op 01:00 die dag."""
+        from date_textparser.core import parse_time_range_full
+
+        result = parse_time_range_full(
+            "binnenkort", tz="America/Havana", now_iso="2025-03-09T12:00:00"
+        )
+        assert result.start.isoformat() == "2025-03-09T01:00:00-04:00"
+        assert result.end.isoformat() == "2025-03-16T23:59:59-04:00"
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tests: Seizoenen
@@ -128,6 +138,12 @@ class TestSeasons:
         assert start == datetime(2025, 12, 1, 0, 0, 0)
         assert end == datetime(2026, 2, 28, 23, 59, 59)
 
+    def test_winter_ends_on_leap_day(self, now: datetime):
+        """'winter 2023' -> dec 2023 t/m 29 feb 2024 (schrikkeljaar)."""
+        start, end = parse_time_range("winter 2023", now=now)
+        assert start == datetime(2023, 12, 1, 0, 0, 0)
+        assert end == datetime(2024, 2, 29, 23, 59, 59)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tests: Weeknummers
@@ -153,6 +169,17 @@ class TestWeekNumbers:
         assert start == datetime(2024, 12, 30, 0, 0, 0)
         assert end == datetime(2025, 1, 5, 23, 59, 59)
 
+    def test_week_53_only_in_long_years(self, now: datetime):
+        """Week 53 bestaat in 2026 (begint ma 28 dec), niet in 2025."""
+        from date_textparser.parsers import parse_week_number
+        import pendulum
+
+        base = pendulum.instance(now, tz="Europe/Amsterdam")
+        start, end = parse_week_number("week 53 2026", base)
+        assert start.isoformat() == "2026-12-28T00:00:00+01:00"
+        assert end.to_date_string() == "2027-01-03"
+        assert parse_week_number("week 53 2025", base) is None
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tests: Half jaar (Semesters)
@@ -228,3 +255,13 @@ class TestWeekends:
         )
         assert start == datetime(2026, 1, 31, 0, 0, 0)
         assert end == datetime(2026, 2, 1, 23, 59, 59)
+
+    def test_vorig_weekend_over_dst_switch(self):
+        """'vorig weekend' over de zomertijdwissel: middernacht en einde in lokale tijd."""
+        from date_textparser.core import parse_time_range_full
+
+        result = parse_time_range_full(
+            "vorig weekend", tz="Europe/Amsterdam", now_iso="2026-04-01T09:00:00"
+        )
+        assert result.start.isoformat() == "2026-03-28T00:00:00+01:00"
+        assert result.end.isoformat() == "2026-03-29T23:59:59+02:00"